@@ -12,12 +12,22 @@ maintaining performance through optimized rendering techniques.
 
 import random
 import math
+import numpy as np
 import pygame
 from .constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, NUM_BACKGROUND_STARS,
     NUM_NEBULAE, RED, BLUE, PURPLE, PINK
 )
 
+# Per-star record layout for BackgroundEffect.stars
+STAR_DTYPE = np.dtype([
+    ('x', np.int32),
+    ('y', np.int32),
+    ('size', np.uint8),
+    ('color', np.uint8, 3),
+    ('twinkle_offset', np.float64),
+])
+
 class BackgroundEffect:
     """
     Manages and renders background visual effects for the game.
@@ -28,25 +38,27 @@ class BackgroundEffect:
     
     The effects are rendered differently in galaxy and system views to create
     distinct atmospheric experiences for each game state.
+    
+    All stars and nebulae are generated with the random module, so calling
+    random.seed(n) before construction reproduces the same background.
     """
     
     def __init__(self):
-        # Generate background stars with twinkling properties
-        self.stars = []
+        # Generate background stars with twinkling properties.
+        # Values are drawn from the random module, in the same order as the
+        # nebulae below, so random.seed() reproduces the whole background.
+        # They are then packed into a NumPy structured array (one column per
+        # property) so the twinkle can be computed in bulk when drawing.
+        star_records = []
         for _ in range(NUM_BACKGROUND_STARS):
             x = random.randint(0, SCREEN_WIDTH)
             y = random.randint(0, SCREEN_HEIGHT)
             size = random.randint(1, 2)
             # Base brightness range 100-180 gives visible but not overpowering stars
             brightness = random.randint(100, 180)
-            # Store star properties including position, appearance, and twinkling data
-            self.stars.append({
-                'x': x,
-                'y': y,
-                'size': size,
-                'color': (brightness, brightness, brightness),
-                'twinkle_offset': random.uniform(0, 2 * math.pi)  # For smoother twinkling
-            })
+            twinkle_offset = random.uniform(0, 2 * math.pi)  # For smoother twinkling
+            star_records.append((x, y, size, (brightness, brightness, brightness), twinkle_offset))
+        self.stars = np.array(star_records, dtype=STAR_DTYPE)
         
         # Generate nebulae
         self.nebulae = []
@@ -110,25 +122,7 @@ class BackgroundEffect:
             screen.blit(nebula_surface, (0, 0))
         
         # Draw stars with twinkling effect
-        # Convert milliseconds to seconds for smoother twinkling calculations
-        current_time = pygame.time.get_ticks() / 1000
-        for star in self.stars:
-            # Calculate twinkling effect:
-            # - Multiply time by 2 for faster oscillation
-            # - Add offset for varied timing between stars
-            # - Multiply by 20 for visible but subtle brightness range
-            brightness_variation = math.sin(current_time * 2 + star['twinkle_offset']) * 20
-            color = list(star['color'])
-            # Apply brightness variation to all RGB components for consistent color
-            for i in range(3):
-                color[i] = max(0, min(255, color[i] + brightness_variation))
-            
-            pygame.draw.circle(
-                screen,
-                color,
-                (star['x'], star['y']),
-                star['size']
-            )
+        self._draw_stars(screen)
 
     def draw_system_background(self, screen):
         """
@@ -142,16 +136,31 @@ class BackgroundEffect:
             screen: Pygame surface to draw on
         """
         # Only draw stars in system view
+        self._draw_stars(screen)
+
+    def _draw_stars(self, screen):
+        """
+        Draw the star field with its twinkling effect.
+        
+        Each star's brightness varies sinusoidally over time. The brightness
+        of all stars is computed at once on the star array, leaving only the
+        draw calls in the Python loop.
+        
+        Args:
+            screen: Pygame surface to draw on
+        """
+        # Convert milliseconds to seconds for smoother twinkling calculations
         current_time = pygame.time.get_ticks() / 1000
-        for star in self.stars:
-            brightness_variation = math.sin(current_time * 2 + star['twinkle_offset']) * 20
-            color = list(star['color'])
-            for i in range(3):
-                color[i] = max(0, min(255, color[i] + brightness_variation))
-            
-            pygame.draw.circle(
-                screen,
-                color,
-                (star['x'], star['y']),
-                star['size']
-            )
+        # Calculate twinkling effect:
+        # - Multiply time by 2 for faster oscillation
+        # - Add offset for varied timing between stars
+        # - Multiply by 20 for visible but subtle brightness range
+        brightness_variation = np.sin(current_time * 2 + self.stars['twinkle_offset']) * 20
+        # Apply brightness variation to all RGB components for consistent color
+        colors = np.clip(self.stars['color'] + brightness_variation[:, np.newaxis], 0, 255)
+        
+        for x, y, size, color in zip(self.stars['x'].tolist(),
+                                     self.stars['y'].tolist(),
+                                     self.stars['size'].tolist(),
+                                     colors.tolist()):
+            pygame.draw.circle(screen, color, (x, y), size)
@@ -3,8 +3,8 @@ import toml
 import argparse
 
 
-def parse_arguments(args):
-    """Parse command line arguments."""
+def _build_parser():
+    """Build the command line argument parser."""
     parser = argparse.ArgumentParser(description='Galaxy Conquest Game')
     parser.add_argument(
         '--log-level',
@@ -19,7 +19,16 @@ def parse_arguments(args):
     parser.add_argument('--num-star-systems', type=int, help='Number of star systems')
     parser.add_argument('--num-background-stars', type=int, help='Number of background stars')
     parser.add_argument('--num-nebulae', type=int, help='Number of nebulae')
-    return parser.parse_args()
+    return parser
+
+
+# Built once at import; parse_args() does not mutate the parser
+_PARSER = _build_parser()
+
+
+def parse_arguments(args):
+    """Parse command line arguments."""
+    return _PARSER.parse_args()
 
 
 def load_config(default_config_path='config/prefs.toml', args=None):
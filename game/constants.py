@@ -3,6 +3,7 @@
 # Screen dimensions
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
+FPS = 60
 
 # Game settings
 NUM_STAR_SYSTEMS = 10
@@ -6,6 +6,13 @@ It provides functionality to:
 - Save game state to JSON files
 - Load game state from JSON files
 - Convert game objects to/from JSON-serializable format
+
+When orjson is installed it is used to encode and decode save files;
+otherwise the standard library json module is used. The text differs
+(orjson writes compact output without spaces after ':' and ','), but both
+backends produce output that decodes to the same data and can read each
+other's save files. orjson's decode error subclasses json.JSONDecodeError,
+so callers only need to handle the latter.
 """
 
 import json
@@ -15,6 +22,11 @@ import random
 import math
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from game.enums import StarType, PlanetType, ResourceType
 from game.planet import Planet
 from game.logging_config import get_logger
@@ -22,6 +34,39 @@ from game.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _dumps(data: Any) -> str:
+    """
+    Encode save data as a JSON string.
+    
+    Args:
+        data: JSON-serializable save data
+        
+    Returns:
+        str: The encoded JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data)
+
+
+def _loads(text: str) -> Any:
+    """
+    Decode save data from a JSON string.
+    
+    Args:
+        text: JSON text read from a save file
+        
+    Returns:
+        The decoded save data
+        
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 def convert_planet_data(planet) -> Dict[str, Any]:
     """
     Convert planet data to JSON-serializable format.
@@ -164,7 +209,7 @@ def save_game_state(star_systems, selected_system=None, empires=None, player_emp
     # Save to file
     save_path = os.path.join(save_dir, filename)
     with open(save_path, 'w') as f:
-        json.dump(save_data, f)
+        f.write(_dumps(save_data))
     
     logger.info("Game state saved successfully")
 
@@ -187,7 +232,7 @@ def load_game_state(save_dir: str = 'saves', filename: str = 'autosave.json') ->
     
     save_path = os.path.join(save_dir, filename)
     with open(save_path, 'r') as f:
-        save_data = json.load(f)
+        save_data = _loads(f.read())
     
     # Convert star systems data
     for system in save_data['star_systems']:
@@ -2,39 +2,108 @@
 """
 Script to revert pygame-ce imports back to pygame imports.
 """
+import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
-def update_file(file_path):
-    """Update pygame-ce imports back to pygame imports in a file."""
-    with open(file_path, 'r') as f:
-        content = f.read()
+# Maps file path -> st_mtime_ns for files already known to be clean
+CACHE_FILE = '.revert_imports.cache'
+
+# Single alternation compiled once so each file is scanned in one pass.
+# Patterns are bytes so files can be rewritten without decoding; the
+# optional '\r' keeps CRLF files matching now that newlines are untranslated.
+_PAT = re.compile(
+    rb'^(import pygame_ce as pygame(?=\r?$)|import pygame_ce\.|from pygame_ce)',
+    re.MULTILINE
+)
+
+def _repl(match):
+    """Return the pygame replacement for a matched pygame-ce import."""
+    s = match.group(1)
+    # 'import pygame_ce as pygame' -> 'import pygame'
+    if s == b'import pygame_ce as pygame':
+        return b'import pygame'
+    # 'import pygame_ce.' -> 'import pygame.'
+    if s.startswith(b'import'):
+        return b'import pygame.'
+    # 'from pygame_ce' -> 'from pygame'
+    return b'from pygame'
+
+def load_cache(cache_file=CACHE_FILE):
+    """Load the clean-file mtime cache, returning an empty one if unusable."""
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_cache(cache, cache_file=CACHE_FILE):
+    """Persist the clean-file mtime cache."""
+    with open(cache_file, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+def update_file(file_path, cache=None):
+    """Update pygame-ce imports back to pygame imports in a file.
     
-    # Replace 'import pygame_ce as pygame' with 'import pygame'
-    updated_content = re.sub(r'^import pygame_ce as pygame$', 'import pygame', content, flags=re.MULTILINE)
+    If a cache dict is given, files whose mtime matches the cached value
+    are skipped without being read, and clean files are recorded in it.
+    """
+    if cache is not None:
+        mtime = os.stat(file_path).st_mtime_ns
+        if cache.get(file_path) == mtime:
+            print(f"No changes needed for {file_path}")
+            return
     
-    # Replace 'import pygame_ce.' with 'import pygame.'
-    updated_content = re.sub(r'^import pygame_ce\.', 'import pygame.', updated_content, flags=re.MULTILINE)
+    with open(file_path, 'rb') as f:
+        content = f.read()
+    
+    # Cheap substring check skips the regex entirely for most files
+    if b'pygame_ce' not in content:
+        if cache is not None:
+            cache[file_path] = mtime
+        print(f"No changes needed for {file_path}")
+        return
     
-    # Replace 'from pygame_ce' with 'from pygame'
-    updated_content = re.sub(r'^from pygame_ce', 'from pygame', updated_content, flags=re.MULTILINE)
+    updated_content, count = _PAT.subn(_repl, content)
     
-    if content != updated_content:
-        with open(file_path, 'w') as f:
+    # Every match rewrites text, so a zero count means the file is unchanged
+    if count:
+        with open(file_path, 'wb') as f:
             f.write(updated_content)
+        if cache is not None:
+            cache[file_path] = os.stat(file_path).st_mtime_ns
         print(f"Updated {file_path}")
     else:
+        if cache is not None:
+            cache[file_path] = mtime
         print(f"No changes needed for {file_path}")
 
-def process_directory(directory):
-    """Process all Python files in a directory recursively."""
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.py'):
-                file_path = os.path.join(root, file)
-                update_file(file_path)
+def _iter_py(root):
+    """Yield paths of Python files under root using os.scandir."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_py(entry.path)
+            elif entry.name.endswith('.py') and entry.is_file(follow_symlinks=False):
+                yield entry.path
+
+def process_directory(directory, cache=None):
+    """Process all Python files in a directory recursively.
+    
+    Files are independent and the work is I/O bound, so they are
+    dispatched to a thread pool to overlap read/write latency.
+    """
+    paths = list(_iter_py(directory))
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(partial(update_file, cache=cache), paths))
 
 if __name__ == "__main__":
-    process_directory('game')
-    process_directory('tests')
+    cache = load_cache()
+    process_directory('game', cache)
+    process_directory('tests', cache)
+    save_cache(cache)
     print("Import updates complete!")
@@ -1,3 +1,10 @@
+# Game and galaxy defaults live in game.constants; re-exported here so the
+# config loader can read and override them through this module
+from game.constants import (  # noqa: F401
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS,
+    NUM_STAR_SYSTEMS, NUM_BACKGROUND_STARS, NUM_NEBULAE
+)
+
 # Debug Settings
 DEBUG = True  # Set to False to disable debug output
 
@@ -5,13 +12,3 @@ DEBUG = True  # Set to False to disable debug output
 DEFAULT_LOG_LEVEL = 'INFO'  # Can be overridden by command line argument
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 LOG_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
-
-# Game Settings
-SCREEN_WIDTH = 800
-SCREEN_HEIGHT = 600
-FPS = 60
-
-# Galaxy Settings
-NUM_STAR_SYSTEMS = 10
-NUM_BACKGROUND_STARS = 200
-NUM_NEBULAE = 3
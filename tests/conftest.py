@@ -1,17 +1,80 @@
-"""Test configuration and fixtures."""
+"""Test configuration and fixtures.
+
+pygame and the game package are imported inside the fixtures that need
+them, so collecting and running pygame-free modules such as test_empire.py
+doesn't pay for importing pygame, pygame_gui and the views.
+"""
+import sys
 import pytest
-from unittest.mock import Mock
-from tests.mocks import MockPygame, MockSurface
-from game.resources import ResourceManager
+from unittest.mock import Mock, MagicMock
+
+@pytest.fixture(scope="session", autouse=True)
+def pygame_session():
+    """Initialize pygame once for the whole test session.
+    
+    pygame.init() already brings up the font module and, when an audio
+    device exists, the mixer; tests use MockFont/MockSound, so no explicit
+    font or mixer init is needed. Nothing is initialized when no collected
+    test module imported pygame.
+    """
+    pygame = sys.modules.get('pygame')
+    if pygame is None:
+        yield
+        return
+    pygame.init()
+    yield
+    pygame.quit()
+
+@pytest.fixture(scope="session")
+def ui_manager():
+    """Create a MockUIManager shared by every MockGame in the session."""
+    from tests.mocks import MockUIManager
+    return MockUIManager()
+
+@pytest.fixture(scope="session")
+def screen_800x600():
+    """Create an 800x600 MockSurface shared by tests that only pass it through."""
+    from tests.mocks import MockSurface
+    return MockSurface((800, 600))
+
+@pytest.fixture(scope="session")
+def screen_surface():
+    """Create a screen-sized pygame Surface shared by tests that draw to it.
+    
+    Tests never read pixels back; call fill() first if a clean surface matters.
+    """
+    import pygame
+    from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+    return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-@pytest.fixture(scope="function")
+@pytest.fixture
+def freeze_ticks(monkeypatch):
+    """Freeze pygame.time.get_ticks at 1000ms.
+    
+    Returns a one-element list; assign to its item to move the clock.
+    """
+    current = [1000]
+    monkeypatch.setattr('pygame.time.get_ticks', lambda: current[0])
+    return current
+
+@pytest.fixture(scope="session")
 def mock_pygame():
-    """Create a mock pygame instance."""
+    """Create a mock pygame instance shared by the whole session.
+    
+    Tests only read from it (ResourceManager stores the modules it is given),
+    so a single instance is safe to share.
+    """
+    from tests.mocks import MockPygame
     return MockPygame()
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def resource_manager(mock_pygame):
-    """Create a ResourceManager instance with mock pygame modules."""
+    """Create a ResourceManager instance with mock pygame modules.
+    
+    Module-scoped so its caches are shared by the tests in a module and
+    cleanup() runs once at module teardown.
+    """
+    from game.resources import ResourceManager
     manager = ResourceManager(
         pygame_module=mock_pygame,
         font_module=mock_pygame.font,
@@ -24,7 +87,114 @@ def resource_manager(mock_pygame):
 @pytest.fixture
 def mock_game(resource_manager):
     """Create a mock game instance for testing."""
+    from tests.mocks import MockSurface
     game = Mock()
     game.screen = MockSurface((800, 600))
     game.resource_manager = resource_manager
-    return game
\ No newline at end of file
+    return game
+
+@pytest.fixture(scope="module")
+def base_game(resource_manager):
+    """Build the Game once per module; reset_game resets it per test."""
+    from game.game import Game
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('game.game.ResourceManagerFactory.create', lambda: resource_manager)
+        return Game()
+
+@pytest.fixture
+def reset_game(base_game):
+    """Return the module's shared Game with its mutable state reset for this test.
+    
+    Per-test overrides of bound methods are dropped so the real ones are
+    used again, selection and galaxy state is cleared, the notification
+    manager is rebuilt, and the views are replaced with fresh MagicMocks to
+    avoid initialization issues.
+    """
+    from game.enums import GameState
+    from game.notifications import NotificationManager
+    game = base_game
+    for name in ('generate_star_systems', 'load_game', 'to_state'):
+        game.__dict__.pop(name, None)
+    
+    game.state = GameState.STARTUP_MENU
+    game.selected_system = None
+    game.selected_planet = None
+    game.hovered_system = None
+    game.star_systems = []
+    game.empires = []
+    game.player_empire = None
+    game.notification_manager = NotificationManager(game.ui_manager)
+    
+    game.startup_view = MagicMock()
+    game.galaxy_view = MagicMock()
+    game.system_view = MagicMock()
+    game.planet_view = MagicMock()
+    game.current_view = game.startup_view
+    return game
+
+@pytest.fixture
+def game_instance(reset_game):
+    """Return the shared Game instance reset to its startup state.
+    
+    Adds the startup menu items, planet images and fonts the tests read on
+    top of reset_game; everything else keeps the values Game.__init__ set.
+    """
+    game = reset_game
+    
+    # Setup startup menu items for testing
+    startup_menu_items = [
+        MagicMock(text="New Game"),
+        MagicMock(text="Load Game"),
+        MagicMock(text="Exit")
+    ]
+    game.startup_view.menu.items = startup_menu_items
+    
+    # Setup planet images for testing
+    game.planet_images = {
+        'desert': MagicMock(),
+        'oceanic': MagicMock()
+    }
+    
+    # Setup fonts for testing
+    game.title_font = MagicMock()
+    game.info_font = MagicMock()
+    game.detail_font = MagicMock()
+    
+    return game
+
+def _sample_save_data():
+    """Return a minimal save-game dict with one star system and one empire."""
+    from game.enums import StarType
+    return {
+        'star_systems': [
+            {
+                'x': 100,
+                'y': 200,
+                'name': 'TestSystem1',
+                'star_type': StarType.MAIN_SEQUENCE,
+                'size': 10,
+                'color': [255, 255, 255],
+                'planets': []
+            }
+        ],
+        'empires': [
+            {
+                'planets': []  # Empty list of planet names for testing
+            }
+        ],
+        'player_empire_index': 0  # First empire is the player's empire
+    }
+
+@pytest.fixture
+def save_game_dummy(monkeypatch):
+    """Replace game.game.save_game_state with a MagicMock and return it."""
+    dummy = MagicMock()
+    monkeypatch.setattr('game.game.save_game_state', dummy)
+    return dummy
+
+@pytest.fixture
+def load_game_dummy(monkeypatch):
+    """Replace game.game.load_game_state with a MagicMock returning sample save data."""
+    dummy = MagicMock(side_effect=_sample_save_data)
+    monkeypatch.setattr('game.game.load_game_state', dummy)
+    return dummy
@@ -1,27 +1,35 @@
 """Mock implementations for pygame objects and modules."""
+from collections import namedtuple
 from unittest.mock import MagicMock, Mock
 import pygame
 import os
 from game.enums import PlanetType, ResourceType, GameState
 
 class MockFont:
+    __slots__ = ('name', 'size')
+    
     def __init__(self, name=None, size=None):
         self.name = name
         self.size = size if size is not None else 24  # Default size to 24 if None
 
     def render(self, text, antialias, color):
+        # A fresh surface per call, like pygame; callers such as TextCache
+        # rely on distinct renders being distinct objects
         return MockSurface((len(text) * self.size // 2, self.size))
 
 class MockSurface:
-    """A mock surface that simulates pygame.Surface."""
+    """A mock surface that simulates pygame.Surface.
+    
+    Deliberately not a pygame.Surface subclass: no SDL pixel buffer is
+    allocated, only the size, flags, alpha and fill color are tracked.
+    """
+    __slots__ = ('_size', '_alpha', 'flags', '_color', '_clip')
+    
     def __init__(self, size=(1, 1), flags=0):
         """Initialize with optional flags parameter."""
-        if isinstance(size, (tuple, list)):
-            self._size = size
-        elif hasattr(size, 'size'):
-            self._size = size.size
-        else:
-            self._size = (size[0], size[1])
+        # Accept a (w, h) sequence or anything with a .size, such as a Rect
+        self._size = (tuple(size) if isinstance(size, (tuple, list))
+                      else getattr(size, 'size', None) or (size[0], size[1]))
         self._alpha = None
         self.flags = flags
         self._color = (0, 0, 0, 255)
@@ -51,22 +59,22 @@ class MockSurface:
     def get_rect(self, **kwargs):
         """Get the rectangle for this surface."""
         rect = pygame.Rect(0, 0, self._size[0], self._size[1])
+        if not kwargs:
+            return rect
+        # center is the only keyword the game passes; handle it directly
+        center = kwargs.pop('center', None)
+        if center is not None:
+            rect.center = center
         for key, value in kwargs.items():
-            if key == 'center':
-                rect.centerx = value[0]
-                rect.centery = value[1]
-            else:
-                setattr(rect, key, value)
+            setattr(rect, key, value)
         return rect
         
     def blit(self, source, dest, area=None, special_flags=0):
         """Mock blit operation."""
-        if isinstance(dest, (pygame.Rect, MockSurface)):
+        dest_type = type(dest)
+        if dest_type is pygame.Rect or dest_type is MockSurface:
             return dest
-        if isinstance(source, pygame.Surface):
-            source_size = source.get_size()
-        else:
-            source_size = source._size if hasattr(source, '_size') else source.get_size()
+        source_size = getattr(source, '_size', None) or source.get_size()
         return pygame.Rect(dest[0], dest[1], source_size[0], source_size[1])
         
     def fill(self, color, rect=None, special_flags=0):
@@ -96,7 +104,13 @@ class MockSurface:
         surf._alpha = self._alpha
         return surf
 
+# Shared read-only placeholders returned by image.load and display.set_mode
+_LOAD_SURF = MockSurface((32, 32))
+_SCREEN_SURF = MockSurface((800, 600))
+
 class MockSound:
+    __slots__ = ('buffer', 'playing')
+    
     def __init__(self, buffer=None):
         self.buffer = buffer
         self.playing = False
@@ -107,96 +121,127 @@ class MockSound:
     def stop(self):
         self.playing = False
 
+# Lightweight stand-in for pygame.event.Event in handlers that only read
+# the event's attributes
+FakeEvent = namedtuple('FakeEvent', ['type', 'key', 'user_type', 'ui_element'],
+                       defaults=[None, None, None])
+
+def mock_surface(*args, **kwargs):
+    """Create a MockSurface, supporting the pygame.Surface flags argument."""
+    if len(args) == 1:
+        size = args[0]
+    elif len(args) == 2:
+        size = args[0]
+    else:
+        size = kwargs.get('size', (1, 1))
+    flags = kwargs.get('flags', 0)
+    if len(args) >= 2:
+        flags = args[1]
+    return MockSurface(size, flags)
+
+def mock_circle(surface, color, pos, radius, width=0):
+    """Mock pygame.draw.circle."""
+    rect = pygame.Rect(pos[0] - radius, pos[1] - radius, radius * 2, radius * 2)
+    if isinstance(surface, MockSurface):
+        surface._color = color
+    return rect
+
+def mock_rect(surface, color, rect, width=0):
+    """Mock pygame.draw.rect."""
+    if isinstance(surface, MockSurface):
+        surface._color = color
+    return rect if isinstance(rect, pygame.Rect) else pygame.Rect(rect)
+
+def mock_line(surface, color, start_pos, end_pos, width=1):
+    """Mock pygame.draw.line."""
+    if isinstance(surface, MockSurface):
+        surface._color = color
+    return pygame.Rect(
+        min(start_pos[0], end_pos[0]),
+        min(start_pos[1], end_pos[1]),
+        abs(end_pos[0] - start_pos[0]) or 1,
+        abs(end_pos[1] - start_pos[1]) or 1
+    )
+
+# os.path.exists results keyed by path, for both hits and misses
+_exists_cache = {}
+
+def _exists(path):
+    """Cached os.path.exists for asset paths loaded by the mocks."""
+    exists = _exists_cache.get(path)
+    if exists is None:
+        exists = _exists_cache[path] = os.path.exists(path)
+    return exists
+
+def clear_exists_cache():
+    """Forget cached existence checks, e.g. after a test creates a file."""
+    _exists_cache.clear()
+
+def mock_load(path):
+    """Mock pygame.image.load."""
+    if not _exists(path):
+        raise FileNotFoundError(f"No such file: {path}")
+    return _LOAD_SURF
+
+def mock_sound(path=None, buffer=None):
+    """Mock pygame.mixer.Sound."""
+    if path is not None and not _exists(path):
+        raise FileNotFoundError(f"No such file: {path}")
+    return MockSound(buffer)
+
+def mock_set_mode(*args, **kwargs):
+    """Mock pygame.display.set_mode."""
+    return _SCREEN_SURF
+
+def _get_init():
+    """Report a mocked subsystem as initialized."""
+    return True
+
+def _noop(*args, **kwargs):
+    """Accept and ignore any arguments."""
+    pass
+
 class MockPygame:
     def __init__(self):
-        # Initialize pygame for testing
-        if not pygame.get_init():
-            pygame.init()
-            pygame.font.init()
-            pygame.mixer.init()
-            
+        # Real pygame is initialized once per session by conftest.pygame_session
         self.init_called = False
         self.quit_called = False
-        self.font = MagicMock()
-        self.mixer = MagicMock()
-        self.display = MagicMock()
+        self.font = Mock()
+        self.mixer = Mock()
+        self.display = Mock()
         self.error = pygame.error
         self.time = pygame.time
         
         # Setup Surface with flags support
-        def mock_surface(*args, **kwargs):
-            if len(args) == 1:
-                size = args[0]
-            elif len(args) == 2:
-                size = args[0]
-            else:
-                size = kwargs.get('size', (1, 1))
-            flags = kwargs.get('flags', 0)
-            if len(args) >= 2:
-                flags = args[1]
-            return MockSurface(size, flags)
         self.Surface = mock_surface
         self.SRCALPHA = 0x00010000
         
-        self.image = MagicMock()
-        self.draw = MagicMock()
+        self.image = Mock()
         
         # Setup draw module
-        def mock_circle(surface, color, pos, radius, width=0):
-            rect = pygame.Rect(pos[0] - radius, pos[1] - radius, radius * 2, radius * 2)
-            if isinstance(surface, (pygame.Surface, MockSurface)):
-                if hasattr(surface, '_color'):
-                    surface._color = color
-            return rect
-            
-        def mock_rect(surface, color, rect, width=0):
-            if isinstance(surface, (pygame.Surface, MockSurface)):
-                if hasattr(surface, '_color'):
-                    surface._color = color
-            return rect if isinstance(rect, pygame.Rect) else pygame.Rect(rect)
-            
-        def mock_line(surface, color, start_pos, end_pos, width=1):
-            if isinstance(surface, (pygame.Surface, MockSurface)):
-                if hasattr(surface, '_color'):
-                    surface._color = color
-            return pygame.Rect(
-                min(start_pos[0], end_pos[0]),
-                min(start_pos[1], end_pos[1]),
-                abs(end_pos[0] - start_pos[0]) or 1,
-                abs(end_pos[1] - start_pos[1]) or 1
-            )
-            
         self.draw = pygame.draw
         self.draw.circle = mock_circle
         self.draw.rect = mock_rect
         self.draw.line = mock_line
         
         # Setup image module
-        def mock_load(path):
-            if not os.path.exists(path):
-                raise FileNotFoundError(f"No such file: {path}")
-            return MockSurface((32, 32))
         self.image.load = mock_load
         
         # Setup font module
         self.font.Font = MockFont
         self.font.SysFont = MockFont
-        self.font.get_init = lambda: True
-        self.font.init = lambda: None
+        self.font.get_init = _get_init
+        self.font.init = _noop
         
         # Setup mixer module
-        def mock_sound(path=None, buffer=None):
-            if path is not None and not os.path.exists(path):
-                raise FileNotFoundError(f"No such file: {path}")
-            return MockSound(buffer)
         self.mixer.Sound = mock_sound
-        self.mixer.get_init = lambda: True
-        self.mixer.init = lambda *args, **kwargs: None
+        self.mixer.get_init = _get_init
+        self.mixer.init = _noop
         
         # Setup display module
-        self.display.get_init = lambda: True
-        self.display.init = lambda: None
-        self.display.set_mode = lambda *args, **kwargs: MockSurface((800, 600))
+        self.display.get_init = _get_init
+        self.display.init = _noop
+        self.display.set_mode = mock_set_mode
         
     def init(self):
         self.init_called = True
@@ -208,38 +253,65 @@ class MockPygame:
         return self.init_called
 
 
+# Shared default rects; callers must replace rather than mutate them
+_DEFAULT_UI_RECT = pygame.Rect(0, 0, 100, 20)
+_DEFAULT_CONTAINER_RECT = pygame.Rect(0, 0, 800, 600)
+
 class MockUIElement:
     """Mock UI element for pygame_gui."""
+    __slots__ = (
+        'relative_rect', 'text', 'manager', 'container', 'object_id', 'visible'
+    )
+    
     def __init__(self, relative_rect=None, text="", manager=None, container=None, object_id=None):
-        self.relative_rect = relative_rect or pygame.Rect(0, 0, 100, 20)
+        self.relative_rect = (relative_rect if relative_rect is not None
+                              else _DEFAULT_UI_RECT)
         self.text = text
         self.manager = manager
         self.container = container
         self.object_id = object_id
         self.visible = True
-        self.kill = MagicMock()
-        self.set_text = MagicMock()
-        self.set_position = MagicMock()
-        self.set_dimensions = MagicMock()
-        self.show = MagicMock()
-        self.hide = MagicMock()
+        
+    def kill(self):
+        """Mock kill method."""
+        pass
+        
+    def set_text(self, text):
+        """Mock set_text method."""
+        pass
+        
+    def set_position(self, position):
+        """Mock set_position method."""
+        pass
+        
+    def set_dimensions(self, dimensions, clamp_to_container=False):
+        """Mock set_dimensions method."""
+        pass
+        
+    def show(self):
+        """Mock show method."""
+        pass
+        
+    def hide(self):
+        """Mock hide method."""
+        pass
 
 class MockUIPanel(MockUIElement):
     """Mock UI panel for pygame_gui."""
-    pass
+    __slots__ = ()
 
 class MockUILabel(MockUIElement):
     """Mock UI label for pygame_gui."""
-    pass
+    __slots__ = ()
 
 class MockUIHorizontalRule(MockUIElement):
     """Mock UI horizontal rule for pygame_gui."""
-    pass
+    __slots__ = ()
 
 class MockContainer:
     """Mock container for pygame_gui."""
     def __init__(self, rect=None):
-        self.rect = rect or pygame.Rect(0, 0, 800, 600)
+        self.rect = rect if rect is not None else _DEFAULT_CONTAINER_RECT
         self.elements = []
         self.visible = 1
         
@@ -263,6 +335,21 @@ class MockContainer:
         """Add an element to the container."""
         self.elements.append(element)
 
+# Default values returned by MockTheme.get_misc_data for common misc data IDs
+_MISC_DATA = {
+    'shape': 'rectangle',
+    'border_width': 1,
+    'shadow_width': 2,
+    'shape_corner_radius': 2,
+    'text_horiz_alignment': 'left',
+    'text_vert_alignment': 'top',
+    'text_horiz_alignment_padding': 0,
+    'text_vert_alignment_padding': 0,
+    'tool_tip_delay': 1.0,
+    'text_shadow_size': 0,
+    'text_shadow_offset': (0, 0),
+}
+
 class MockTheme:
     """Mock theme for pygame_gui."""
     def __init__(self):
@@ -300,55 +387,60 @@ class MockTheme:
         Returns:
             A default value based on the requested data ID
         """
-        # Return default values for common misc data IDs
-        if misc_data_id == 'shape':
-            return 'rectangle'
-        elif misc_data_id == 'border_width':
-            return 1
-        elif misc_data_id == 'shadow_width':
-            return 2
-        elif misc_data_id == 'shape_corner_radius':
-            return 2
-        elif misc_data_id == 'text_horiz_alignment':
-            return 'left'
-        elif misc_data_id == 'text_vert_alignment':
-            return 'top'
-        elif misc_data_id == 'text_horiz_alignment_padding':
-            return 0
-        elif misc_data_id == 'text_vert_alignment_padding':
-            return 0
-        elif misc_data_id == 'tool_tip_delay':
-            return 1.0
-        elif misc_data_id == 'text_shadow_size':
-            return 0
-        elif misc_data_id == 'text_shadow_offset':
-            return (0, 0)
-        # Return a default value for any other misc data ID
-        return None
+        # Unknown IDs fall back to None
+        return _MISC_DATA.get(misc_data_id)
 
 class MockUIManager:
     """Mock UI manager for pygame_gui."""
     def __init__(self):
-        self.process_events = MagicMock()
-        self.update = MagicMock()
-        self.draw_ui = MagicMock()
         self.theme = MockTheme()
-        self.get_theme = MagicMock(return_value=self.theme)
-        self.get_sprite_group = MagicMock(return_value=pygame.sprite.Group())
-        self.clear_and_reset = MagicMock()
-        self.set_visual_debug_mode = MagicMock()
-        self.root_container = MockContainer(pygame.Rect(0, 0, 800, 600))
+        self._sprite_group = None
+        self._shadow = MockSurface((100, 100))
+        self.root_container = MockContainer()
         
         # Create a MagicMock for the root container that will be returned by get_root_container
         # This ensures the returned object has a get_container method
         self.mock_root_container = MagicMock()
         # Make the get_container method of the mock return the actual root_container
         self.mock_root_container.get_container = MagicMock(return_value=self.root_container)
-        # Set up get_root_container to return the mock_root_container
-        self.get_root_container = MagicMock(return_value=self.mock_root_container)
         
-        # Add get_shadow method
-        self.get_shadow = MagicMock(return_value=MockSurface((100, 100)))
+    def process_events(self, event):
+        """Mock process_events method."""
+        pass
+        
+    def update(self, time_delta):
+        """Mock update method."""
+        pass
+        
+    def draw_ui(self, window_surface):
+        """Mock draw_ui method."""
+        pass
+        
+    def clear_and_reset(self):
+        """Mock clear_and_reset method."""
+        pass
+        
+    def set_visual_debug_mode(self, is_active):
+        """Mock set_visual_debug_mode method."""
+        pass
+        
+    def get_theme(self):
+        """Return the mock theme."""
+        return self.theme
+        
+    def get_sprite_group(self):
+        """Return the sprite group, creating it on first use."""
+        if self._sprite_group is None:
+            self._sprite_group = pygame.sprite.Group()
+        return self._sprite_group
+        
+    def get_root_container(self):
+        """Return the mock root container."""
+        return self.mock_root_container
+        
+    def get_shadow(self, *args, **kwargs):
+        """Return a placeholder shadow surface."""
+        return self._shadow
 
 class MockDebug:
     """Mock Debug class for testing."""
@@ -396,16 +488,32 @@ class MockDebug:
         """Mock enabled property."""
         return self._enabled
 
+# MockGame attributes built lazily, mapped to their MagicMock kwargs
+_LAZY_MOCKS = {
+    # Views call methods such as draw_system_view on it, so it stays a mock
+    'selected_system': {'color': (255, 255, 255), 'star_type.value': 'Test Type'},
+    'startup_view': {},
+    'galaxy_view': {},
+    'system_view': {},
+    'planet_view': {},
+    'info_panel': {},
+    'new_game': {'return_value': True},
+    'save_game': {'return_value': True},
+    'return_to_game': {'return_value': True},
+    'quit_to_main_menu': {'return_value': True},
+    'quit_game': {'return_value': True},
+    'go_to_galaxy_view': {'return_value': True},
+}
+
 class MockGame:
     """Mock game class for testing planet view."""
-    def __init__(self):
-        # Initialize ui_manager first
-        self.ui_manager = MockUIManager()
+    def __init__(self, ui_manager=None):
+        # Initialize ui_manager first; a shared stateless one may be passed in
+        self.ui_manager = ui_manager if ui_manager is not None else MockUIManager()
         
         # Initialize debug instance
         self.debug = MockDebug(self, self.ui_manager)
         
-        self.startup_view = MagicMock()
         # Import Planet class here to avoid circular imports
         from game.planet import Planet
         
@@ -420,37 +528,30 @@ class MockGame:
                 {'type': ResourceType.WATER, 'amount': 50}
             ]
         )
-        self.background = MockBackground()
+        self.background = _MOCK_BACKGROUND
         self.state = GameState.PLANET
         self.star_systems = []
         self.hovered_system = None
         self.hovered_planet = None
-        self.selected_system = MagicMock()
-        self.selected_system.color = (255, 255, 255)
-        self.selected_system.star_type.value = 'Test Type'
-        
         # Initialize info_font, detail_font, and title_font
         self.info_font = MockFont()
         self.detail_font = MockFont()
         self.title_font = MockFont()
         
-        # Initialize views after ui_manager
-        self.galaxy_view = MagicMock()
-        self.system_view = MagicMock()
-        self.planet_view = MagicMock()
-        
-        # Initialize info_panel
-        self.info_panel = MagicMock()
-        
-        # Add methods needed for view initialization
-        self.new_game = MagicMock(return_value=True)
-        self.save_game = MagicMock(return_value=True)
-        self.return_to_game = MagicMock(return_value=True)
-        self.quit_to_main_menu = MagicMock(return_value=True)
-        self.quit_game = MagicMock(return_value=True)
-        self.go_to_galaxy_view = MagicMock(return_value=True)
         self.to_state = MagicMock(side_effect=self._to_state)
         
+    def __getattr__(self, name):
+        """Create the view, panel and action mocks on first access.
+        
+        Only the names in _LAZY_MOCKS are created; any other missing
+        attribute still raises AttributeError.
+        """
+        if name not in _LAZY_MOCKS:
+            raise AttributeError(name)
+        mock = MagicMock(**_LAZY_MOCKS[name])
+        setattr(self, name, mock)
+        return mock
+        
     def _to_state(self, old_state, new_state):
         """Mock implementation of to_state that updates the game state."""
         self.state = new_state
@@ -459,11 +560,14 @@ class MockGame:
         """Mock info panel drawing."""
         pass
 
+# Shared default panel rect; callers must replace rather than mutate it
+_DEFAULT_PANEL_RECT = pygame.Rect(0, 0, 300, 600)
+
 class MockInfoPanel:
     """Mock info panel class for testing
     planet view."""
     def __init__(self, game):
-        self.panel_rect = pygame.Rect(0, 0, 300, 600)
+        self.panel_rect = _DEFAULT_PANEL_RECT
         self.panel_width = 300
         self.game = game
         
@@ -516,7 +620,13 @@ class MockInfoPanel:
         return start_y + 100  # Return a reasonable y-coordinate
 
 class MockBackground:
-    """Mock background class for testing."""
+    """Mock background class for testing.
+    
+    Stateless and slot-free so the shared _MOCK_BACKGROUND cannot be altered;
+    tests that need to inspect calls replace game.background instead.
+    """
+    __slots__ = ()
+    
     def draw_system_background(self, screen):
         """Mock system background drawing."""
         pass
@@ -524,3 +634,6 @@ class MockBackground:
     def draw_galaxy_background(self, screen):
         """Mock galaxy background drawing."""
         pass
+
+# MockBackground is stateless, so every MockGame shares one instance
+_MOCK_BACKGROUND = MockBackground()
@@ -1,37 +1,37 @@
 """Tests for the BackgroundEffect class."""
+import random
+import numpy as np
 import pytest
-import pygame
+from unittest.mock import patch
 from game.background import BackgroundEffect
 from game.constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT, NUM_BACKGROUND_STARS,
     NUM_NEBULAE, RED, BLUE, PURPLE, PINK
 )
 
-# Initialize pygame for testing
-pygame.init()
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def background():
-    """Create a background effect instance for testing."""
+    """Create a background effect instance shared by the module's tests."""
     return BackgroundEffect()
 
 @pytest.fixture
-def screen():
-    """Create a pygame surface for testing."""
-    return pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+def screen(screen_surface):
+    """Return the session's shared screen surface cleared to black."""
+    screen_surface.fill((0, 0, 0))
+    return screen_surface
 
 def test_background_initialization(background):
     """Test that background effects are properly initialized."""
-    # Test stars initialization
-    assert len(background.stars) == NUM_BACKGROUND_STARS
-    for star in background.stars:
-        assert 0 <= star['x'] <= SCREEN_WIDTH
-        assert 0 <= star['y'] <= SCREEN_HEIGHT
-        assert 1 <= star['size'] <= 2
-        assert isinstance(star['color'], tuple)
-        assert len(star['color']) == 3
-        assert all(100 <= c <= 180 for c in star['color'])
-        assert 0 <= star['twinkle_offset'] <= 2 * 3.14159
+    # Test stars initialization; stars are a structured array, one field
+    # per property
+    stars = background.stars
+    assert len(stars) == NUM_BACKGROUND_STARS
+    assert stars['color'].shape == (NUM_BACKGROUND_STARS, 3)
+    assert np.all((stars['x'] >= 0) & (stars['x'] <= SCREEN_WIDTH))
+    assert np.all((stars['y'] >= 0) & (stars['y'] <= SCREEN_HEIGHT))
+    assert np.all((stars['size'] >= 1) & (stars['size'] <= 2))
+    assert np.all((stars['color'] >= 100) & (stars['color'] <= 180))
+    assert np.all((stars['twinkle_offset'] >= 0) & (stars['twinkle_offset'] <= 2 * 3.14159))
 
     # Test nebulae initialization
     assert len(background.nebulae) == NUM_NEBULAE
@@ -48,8 +48,18 @@ def test_background_initialization(background):
             assert isinstance(particle, dict)
             assert 'x' in particle
             assert 'y' in particle
-            assert 'size' in particle
-            assert 20 <= particle['size'] <= 35
+        particle_sizes = np.array([p['size'] for p in nebula['particles']])
+        assert np.all((particle_sizes >= 20) & (particle_sizes <= 35))
+
+def test_background_seeding():
+    """Test that seeding the random module reproduces the whole background."""
+    random.seed(1234)
+    first = BackgroundEffect()
+    random.seed(1234)
+    second = BackgroundEffect()
+    
+    assert np.array_equal(first.stars, second.stars)
+    assert first.nebulae == second.nebulae
 
 def test_draw_galaxy_background(background, screen):
     """Test drawing the galaxy background."""
@@ -95,21 +105,19 @@ def test_draw_system_background(background, screen):
 
 def test_star_twinkling(background, screen):
     """Test that stars twinkle over time."""
-    # Draw background and sample star colors
-    background.draw_system_background(screen)
-    first_colors = []
-    for star in background.stars:
-        x, y = int(star['x']), int(star['y'])
-        if 0 <= x < SCREEN_WIDTH and 0 <= y < SCREEN_HEIGHT:
-            first_colors.append((x, y, screen.get_at((x, y))))
-    
-    # Simulate time passing
-    pygame.time.set_timer(pygame.USEREVENT, 500)  # 500ms
-    pygame.event.wait()  # Wait for the timer event
-    
-    # Clear and redraw
-    screen.fill((0, 0, 0))
-    background.draw_system_background(screen)
+    # Simulate 500ms passing between the two draws without waiting
+    with patch('game.background.pygame.time.get_ticks', side_effect=[0, 500]):
+        # Draw background and sample star colors
+        background.draw_system_background(screen)
+        first_colors = []
+        for star in background.stars:
+            x, y = int(star['x']), int(star['y'])
+            if 0 <= x < SCREEN_WIDTH and 0 <= y < SCREEN_HEIGHT:
+                first_colors.append((x, y, screen.get_at((x, y))))
+        
+        # Clear and redraw
+        screen.fill((0, 0, 0))
+        background.draw_system_background(screen)
     
     # Check if any star colors changed
     changes_found = False
@@ -2,7 +2,8 @@
 import os
 import sys
 import pytest
-from unittest.mock import mock_open, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 import argparse
 from game.config import load_config, apply_config, parse_arguments
 
@@ -27,43 +28,34 @@ num_background_stars = 300
 num_nebulae = 5
 """
 
+@pytest.fixture(scope="module")
+def sample_toml_file(tmp_path_factory):
+    """Write SAMPLE_CONFIG to a real file once for the module."""
+    path = tmp_path_factory.mktemp("cfg") / "prefs.toml"
+    path.write_text(SAMPLE_CONFIG)
+    return str(path)
+
 @pytest.fixture
-def mock_settings():
+def mock_settings(monkeypatch):
     """Mock the settings module for testing."""
-    # Create a mock settings module
-    mock_settings = MagicMock()
-    mock_settings.DEBUG = False
-    mock_settings.DEFAULT_LOG_LEVEL = "DEBUG"
-    mock_settings.LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
-    mock_settings.LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
-    mock_settings.SCREEN_WIDTH = 800
-    mock_settings.SCREEN_HEIGHT = 600
-    mock_settings.FPS = 30
-    mock_settings.NUM_STAR_SYSTEMS = 10
-    mock_settings.NUM_BACKGROUND_STARS = 200
-    mock_settings.NUM_NEBULAE = 3
-    
-    # Store original settings module if it exists
-    original_settings = sys.modules.get('settings', None)
+    # Create a stand-in settings module holding plain attributes
+    mock_settings = SimpleNamespace(
+        DEBUG=False,
+        DEFAULT_LOG_LEVEL="DEBUG",
+        LOG_FORMAT="%(asctime)s - %(levelname)s - %(message)s",
+        LOG_DATE_FORMAT="%Y-%m-%d %H:%M:%S",
+        SCREEN_WIDTH=800,
+        SCREEN_HEIGHT=600,
+        FPS=30,
+        NUM_STAR_SYSTEMS=10,
+        NUM_BACKGROUND_STARS=200,
+        NUM_NEBULAE=3
+    )
     
-    # Replace with our mock
-    sys.modules['settings'] = mock_settings
+    # monkeypatch restores (or removes) the original entry on teardown
+    monkeypatch.setitem(sys.modules, 'settings', mock_settings)
     
-    yield mock_settings
-    
-    # Restore original settings module
-    if original_settings:
-        sys.modules['settings'] = original_settings
-    else:
-        del sys.modules['settings']
-
-@pytest.fixture(autouse=True)
-def mock_gettext():
-    """Mock gettext to avoid bytes issues with mock_open."""
-    with patch('gettext.find'), \
-         patch('gettext.translation'), \
-         patch('gettext.gettext', side_effect=lambda x: x):
-        yield
+    return mock_settings
 
 def test_load_config_defaults(mock_settings):
     """Test loading default configuration when no file exists."""
@@ -75,17 +67,14 @@ def test_load_config_defaults(mock_settings):
         assert config['game']['screen_width'] == mock_settings.SCREEN_WIDTH
         assert config['galaxy']['num_star_systems'] == mock_settings.NUM_STAR_SYSTEMS
 
-def test_load_config_from_toml(mock_settings):
+def test_load_config_from_toml(mock_settings, sample_toml_file):
     """Test loading configuration from TOML file."""
-    mock_file = mock_open(read_data=SAMPLE_CONFIG)
-    with patch('os.path.exists', return_value=True), \
-         patch('builtins.open', mock_file):
-        config = load_config('config/prefs.toml', args=[])
-        
-        assert config['debug']['enabled'] is True
-        assert config['logging']['level'] == "INFO"
-        assert config['game']['screen_width'] == 1024
-        assert config['galaxy']['num_star_systems'] == 15
+    config = load_config(sample_toml_file, args=[])
+    
+    assert config['debug']['enabled'] is True
+    assert config['logging']['level'] == "INFO"
+    assert config['game']['screen_width'] == 1024
+    assert config['galaxy']['num_star_systems'] == 15
 
 def test_load_config_with_cli_override(mock_settings):
     """Test command-line arguments overriding configuration."""
@@ -150,38 +139,34 @@ def test_parse_arguments():
         assert args.num_background_stars == 400
         assert args.num_nebulae == 6
 
-def test_load_config_invalid_toml(mock_settings):
+def test_load_config_invalid_toml(mock_settings, tmp_path):
     """Test handling of invalid TOML configuration."""
-    invalid_config = "invalid = toml [ content"
-    mock_file = mock_open(read_data=invalid_config)
+    config_path = tmp_path / "prefs.toml"
+    config_path.write_text("invalid = toml [ content")
     
-    with patch('os.path.exists', return_value=True), \
-         patch('builtins.open', mock_file), \
-         patch('builtins.print') as mock_print:
-        config = load_config('config/prefs.toml', args=[])
+    with patch('builtins.print') as mock_print:
+        config = load_config(str(config_path), args=[])
         
         # Should fall back to default values
         assert config['debug']['enabled'] == mock_settings.DEBUG
         assert config['logging']['level'] == mock_settings.DEFAULT_LOG_LEVEL
         assert mock_print.called  # Warning should be printed
 
-def test_load_config_partial_toml(mock_settings):
+def test_load_config_partial_toml(mock_settings, tmp_path):
     """Test loading partial TOML configuration."""
-    partial_config = """
+    config_path = tmp_path / "prefs.toml"
+    config_path.write_text("""
     [game]
     screen_width = 1024
     screen_height = 768
-    """
-    mock_file = mock_open(read_data=partial_config)
+    """)
     
-    with patch('os.path.exists', return_value=True), \
-         patch('builtins.open', mock_file):
-        config = load_config('config/prefs.toml', args=[])
-        
-        # Specified values should be loaded
-        assert config['game']['screen_width'] == 1024
-        assert config['game']['screen_height'] == 768
-        
-        # Unspecified values should use defaults
-        assert config['debug']['enabled'] == mock_settings.DEBUG
-        assert config['logging']['level'] == mock_settings.DEFAULT_LOG_LEVEL
+    config = load_config(str(config_path), args=[])
+    
+    # Specified values should be loaded
+    assert config['game']['screen_width'] == 1024
+    assert config['game']['screen_height'] == 768
+    
+    # Unspecified values should use defaults
+    assert config['debug']['enabled'] == mock_settings.DEBUG
+    assert config['logging']['level'] == mock_settings.DEFAULT_LOG_LEVEL
@@ -1,13 +1,12 @@
 """Unit tests for the Empire class."""
 import pytest
-from unittest.mock import MagicMock
 from game.empire import Empire
 
 
 @pytest.fixture
 def mock_game():
-    """Fixture providing a mock game instance."""
-    return MagicMock()
+    """Fixture providing a stand-in game instance."""
+    return object()
 
 
 @pytest.fixture
@@ -18,8 +17,17 @@ def empire(mock_game):
 
 @pytest.fixture
 def mock_planet():
-    """Fixture providing a mock planet instance."""
-    return MagicMock()
+    """Fixture providing a stand-in planet instance.
+    
+    Empire only stores and compares planets, so a bare object() is enough.
+    """
+    return object()
+
+
+@pytest.fixture(scope="session")
+def planet_pool():
+    """Fixture providing distinct stand-in planets to slice from."""
+    return [object() for _ in range(32)]
 
 
 def test_empire_initialization(empire, mock_game):
@@ -35,7 +43,7 @@ def test_empire_initialization(empire, mock_game):
 
 
 @pytest.mark.parametrize("num_planets", [1, 2, 5, 10])
-def test_add_multiple_planets(empire, num_planets):
+def test_add_multiple_planets(empire, planet_pool, num_planets):
     """
     Test adding multiple planets to the empire.
     
@@ -47,7 +55,7 @@ def test_add_multiple_planets(empire, num_planets):
     2. Planet count matches expected count
     3. Each planet is accessible in the planets list
     """
-    planets = [MagicMock() for _ in range(num_planets)]
+    planets = planet_pool[:num_planets]
     for planet in planets:
         empire.add_planet(planet)
     
@@ -111,13 +119,13 @@ def test_remove_nonexistent_planet(empire, mock_planet):
     3. No side effects occur
     """
     initial_planets = empire.planets.copy()
-    another_mock_planet = MagicMock()
+    another_mock_planet = object()
     empire.remove_planet(another_mock_planet)
     assert len(empire.planets) == 0
     assert empire.planets == initial_planets
 
 
-def test_remove_planet_from_multiple(empire):
+def test_remove_planet_from_multiple(empire, planet_pool):
     """
     Test removing a specific planet when multiple planets exist.
     
@@ -127,7 +135,7 @@ def test_remove_planet_from_multiple(empire):
     3. Other planets remain unchanged
     4. Order is preserved
     """
-    planets = [MagicMock() for _ in range(3)]
+    planets = planet_pool[:3]
     for planet in planets:
         empire.add_planet(planet)
     
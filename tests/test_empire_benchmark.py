@@ -0,0 +1,31 @@
+"""Benchmarks for Empire planet bookkeeping.
+
+Requires pytest-benchmark; the module is skipped when it is not installed.
+Run only the benchmarks with ``pytest tests/test_empire_benchmark.py --benchmark-only``.
+"""
+import pytest
+from game.empire import Empire
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("num_planets", [100, 1000, 10000])
+def test_bench_add_remove(benchmark, num_planets):
+    """
+    Benchmark adding and then removing num_planets planets.
+    
+    Scaling the planet count exposes the cost of the membership check and
+    list.remove in Empire.remove_planet.
+    """
+    planets = [object() for _ in range(num_planets)]
+    
+    def workload():
+        empire = Empire(None)
+        for planet in planets:
+            empire.add_planet(planet)
+        for planet in planets:
+            empire.remove_planet(planet)
+        return empire
+    
+    empire = benchmark(workload)
+    assert empire.planets == []
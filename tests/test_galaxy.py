@@ -2,7 +2,8 @@
 
 import pytest
 import pygame
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 from game.views.galaxy import GalaxyView
 from game.views.infopanel import GalaxyViewInfoPanel
@@ -10,25 +11,31 @@ from game.enums import GameState
 from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 from tests.mocks import MockGame, MockSurface
 
-@pytest.fixture(autouse=True)
-def setup_and_cleanup():
-    """Setup and cleanup pygame for each test."""
-    pygame.init()
-    pygame.font.init()
-    yield
-    pygame.font.quit()
-    pygame.quit()
-
 @pytest.fixture
-def mock_game():
+def mock_game(ui_manager):
     """Create a mock game instance for testing."""
-    return MockGame()
+    return MockGame(ui_manager)
 
 @pytest.fixture
 def mock_screen():
     """Create a mock screen surface for testing."""
     return MockSurface((SCREEN_WIDTH, SCREEN_HEIGHT))
 
+@pytest.fixture(scope="module")
+def _draw_mock_pool():
+    """Build the star system and background mocks once per module."""
+    systems = [MagicMock(spec=['draw_galaxy_view', 'name', 'rect', 'x', 'y']) for _ in range(2)]
+    return systems, MagicMock()
+
+@pytest.fixture
+def draw_mocks(_draw_mock_pool):
+    """Return the pooled star system and background mocks with calls reset."""
+    systems, background = _draw_mock_pool
+    for system in systems:
+        system.reset_mock()
+    background.reset_mock()
+    return systems, background
+
 @pytest.fixture
 def mock_panel(mock_game):
     """Create a mock panel for testing."""
@@ -38,111 +45,68 @@ def mock_panel(mock_game):
     return panel
 
 @pytest.fixture
-def galaxy_view(mock_game, mock_panel):
+def galaxy_view(monkeypatch, mock_game, mock_panel):
     """Create a GalaxyView instance for testing."""
-    with patch('game.views.galaxy.GalaxyViewInfoPanel', return_value=mock_panel):
-        view = GalaxyView(mock_game)
-        return view
+    monkeypatch.setattr('game.views.galaxy.GalaxyViewInfoPanel', lambda *args, **kwargs: mock_panel)
+    return GalaxyView(mock_game)
 
 class TestGalaxyViewInitialization:
     """Tests for GalaxyView initialization."""
     
-    def test_initialization(self, mock_game, mock_panel):
+    def test_initialization(self, monkeypatch, mock_game, mock_panel):
         """Test that GalaxyView initializes correctly."""
-        with patch('game.views.galaxy.GalaxyViewInfoPanel', return_value=mock_panel):
-            view = GalaxyView(mock_game)
-            
-            assert view.game == mock_game
-            assert view.panel is not None
-            assert view.galaxy_rect.width == SCREEN_WIDTH - view.panel.panel_width
-            assert view.galaxy_rect.height == SCREEN_HEIGHT
-            assert view.menu is not None
-            assert len(view.menu.items) == 5  # Check that menu has 5 items
+        monkeypatch.setattr('game.views.galaxy.GalaxyViewInfoPanel', lambda *args, **kwargs: mock_panel)
+        view = GalaxyView(mock_game)
+        
+        assert view.game == mock_game
+        assert view.panel is not None
+        assert view.galaxy_rect.width == SCREEN_WIDTH - view.panel.panel_width
+        assert view.galaxy_rect.height == SCREEN_HEIGHT
+        assert view.menu is not None
+        assert len(view.menu.items) == 5  # Check that menu has 5 items
 
 class TestGalaxyViewKeyHandling:
     """Tests for GalaxyView key handling."""
     
-    def test_handle_keydown_escape(self, galaxy_view, mock_game):
-        """Test that pressing escape transitions to GALAXY_MENU state."""
-        # Create a mock event with escape key
-        event = MagicMock()
-        event.key = pygame.K_ESCAPE
-        
-        # Handle the key event
-        galaxy_view.handle_keydown(event)
-        
-        # Verify that to_state was called with the correct parameters
-        mock_game.to_state.assert_called_once_with(GameState.GALAXY, GameState.GALAXY_MENU)
-    
-    def test_handle_keydown_other_key(self, galaxy_view, mock_game):
-        """Test handling of non-escape keys."""
-        # Set initial state
+    @pytest.mark.parametrize("key,expected_transition", [
+        (pygame.K_ESCAPE, (GameState.GALAXY, GameState.GALAXY_MENU)),
+        (pygame.K_SPACE, None),
+    ], ids=["escape", "other_key"])
+    def test_handle_keydown(self, galaxy_view, mock_game, key, expected_transition):
+        """Test that only escape transitions to the GALAXY_MENU state."""
         mock_game.state = GameState.GALAXY
+        event = MagicMock(key=key)
         
-        # Create a mock event with a non-escape key
-        event = MagicMock()
-        event.key = pygame.K_SPACE
-        
-        # Handle the key event
         galaxy_view.handle_keydown(event)
         
-        # Verify that the game state did not change
-        assert mock_game.state == GameState.GALAXY
+        if expected_transition:
+            mock_game.to_state.assert_called_once_with(*expected_transition)
+        else:
+            mock_game.to_state.assert_not_called()
+            assert mock_game.state == GameState.GALAXY
 
 class TestGalaxyViewMouseHandling:
     """Tests for GalaxyView mouse handling."""
     
-    def test_handle_click_outside_galaxy_rect(self, galaxy_view, mock_game):
-        """Test handling of clicks outside the galaxy rectangle."""
-        # Position outside the galaxy rectangle (in the info panel area)
-        pos = (SCREEN_WIDTH - 10, SCREEN_HEIGHT // 2)
-        
-        # Store the initial selected system
-        initial_system = mock_game.selected_system
-        
-        # Handle the click
-        galaxy_view.handle_click(pos)
-        
-        # Verify that the selected system didn't change
-        assert mock_game.selected_system == initial_system
-    
-    def test_handle_click_on_system(self, galaxy_view, mock_game):
-        """Test handling of clicks on a star system."""
-        # Create a mock star system
-        system = MagicMock()
-        system.name = "Test System"
-        system.rect = pygame.Rect(100, 100, 50, 50)
+    @pytest.mark.parametrize("pos,expect_selected", [
+        ((SCREEN_WIDTH - 10, SCREEN_HEIGHT // 2), False),
+        ((125, 125), True),
+        ((200, 200), False),
+    ], ids=["outside_galaxy_rect", "on_system", "not_on_system"])
+    def test_handle_click(self, galaxy_view, mock_game, pos, expect_selected):
+        """Test that only a click on a star system selects it and opens the system view."""
+        system = SimpleNamespace(name="Test System", rect=pygame.Rect(100, 100, 50, 50))
         mock_game.star_systems = [system]
-        
-        # Position inside the system's rect
-        pos = (125, 125)
-        
-        # Handle the click
-        galaxy_view.handle_click(pos)
-        
-        # Verify that the system was selected and to_state was called
-        assert mock_game.selected_system == system
-        mock_game.to_state.assert_called_once_with(GameState.GALAXY, GameState.SYSTEM)
-    
-    def test_handle_click_not_on_system(self, galaxy_view, mock_game):
-        """Test handling of clicks not on any star system."""
-        # Create a mock star system
-        system = MagicMock()
-        system.name = "Test System"
-        system.rect = pygame.Rect(100, 100, 50, 50)
-        mock_game.star_systems = [system]
-        
-        # Clear the selected system
         mock_game.selected_system = None
         
-        # Position not inside any system's rect
-        pos = (200, 200)
-        
-        # Handle the click
         galaxy_view.handle_click(pos)
         
-        # Verify that no system was selected
-        assert mock_game.selected_system is None
+        if expect_selected:
+            assert mock_game.selected_system == system
+            mock_game.to_state.assert_called_once_with(GameState.GALAXY, GameState.SYSTEM)
+        else:
+            assert mock_game.selected_system is None
+            mock_game.to_state.assert_not_called()
     
     def test_handle_right_click_outside_galaxy_rect(self, galaxy_view, mock_game):
         """Test handling of right clicks outside the galaxy rectangle."""
@@ -170,20 +134,19 @@ class TestGalaxyViewMouseHandling:
 class TestGalaxyViewDrawing:
     """Tests for GalaxyView drawing."""
     
-    def test_draw_normal_state(self, galaxy_view, mock_game, mock_screen):
+    def test_draw_normal_state(self, monkeypatch, galaxy_view, mock_game, mock_screen, draw_mocks):
         """Test drawing in normal state."""
         # Set up mock game state
         mock_game.state = GameState.GALAXY
-        mock_game.star_systems = [MagicMock(), MagicMock()]
+        systems, background = draw_mocks
+        mock_game.star_systems = systems
         
-        # Mock the background and panel draw methods
-        mock_game.background.draw_galaxy_background = MagicMock()
-        galaxy_view.panel.draw = MagicMock()
+        # Use the pooled background mock; the panel fixture supplies a fresh draw mock
+        mock_game.background = background
         
         # Patch pygame.draw.line to avoid TypeError with MockSurface
-        with patch('pygame.draw.line', return_value=None):
-            # Draw the view
-            galaxy_view.draw(mock_screen)
+        monkeypatch.setattr('pygame.draw.line', lambda *args, **kwargs: None)
+        galaxy_view.draw(mock_screen)
         
         # Verify that the background and panel were drawn
         mock_game.background.draw_galaxy_background.assert_called_once_with(mock_screen)
@@ -193,20 +156,19 @@ class TestGalaxyViewDrawing:
         for system in mock_game.star_systems:
             system.draw_galaxy_view.assert_called_once_with(mock_screen)
     
-    def test_draw_menu_state(self, galaxy_view, mock_game, mock_screen):
+    def test_draw_menu_state(self, monkeypatch, galaxy_view, mock_game, mock_screen, draw_mocks):
         """Test drawing in menu state."""
         # Set up mock game state
         mock_game.state = GameState.GALAXY_MENU
-        mock_game.star_systems = [MagicMock(), MagicMock()]
+        systems, background = draw_mocks
+        mock_game.star_systems = systems
         
-        # Mock the background and panel draw methods
-        mock_game.background.draw_galaxy_background = MagicMock()
-        galaxy_view.panel.draw = MagicMock()
+        # Use the pooled background mock; the panel fixture supplies a fresh draw mock
+        mock_game.background = background
         
         # Patch pygame.draw.line to avoid TypeError with MockSurface
-        with patch('pygame.draw.line', return_value=None):
-            # Draw the view
-            galaxy_view.draw(mock_screen)
+        monkeypatch.setattr('pygame.draw.line', lambda *args, **kwargs: None)
+        galaxy_view.draw(mock_screen)
         
         # Verify that the background and panel were drawn
         # Note: Menu drawing is now handled by the game loop, not in the view's draw method
@@ -6,142 +6,112 @@ improving the overall test coverage.
 """
 
 import pytest
-import pygame
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock
 from game.game import Game
+from game.star_system import StarSystem
 from game.notifications import NotificationManager
 from game.enums import GameState
-from tests.mocks import MockSurface
 
-# Dummy implementations for save/load functions used in testing.
-def dummy_save_game_state(star_systems, selected_system, empires=None, player_empire=None):
-    dummy_save_game_state.called = True
-    dummy_save_game_state.star_systems = star_systems
-    dummy_save_game_state.selected_system = selected_system
-    dummy_save_game_state.empires = empires
-    dummy_save_game_state.player_empire = player_empire
+# Target state of each Game action that transitions unconditionally
+TRANSITIONS = {
+    'new_game': GameState.GALAXY,
+    'go_to_galaxy_view': GameState.GALAXY,
+    'load_game': GameState.GALAXY,
+    'quit_to_main_menu': GameState.STARTUP_MENU,
+}
 
-dummy_save_game_state.called = False
+class MockStarSystem:
+    """Stand-in for StarSystem that never collides with other systems."""
+    
+    def __init__(self, x, y, game_instance, **kwargs):
+        self.x = x
+        self.y = y
+        self.game = game_instance
+        self.name = kwargs.get('name', 'MockSystem')
+    
+    def collides_with(self, other):
+        return False
 
-def dummy_load_game_state():
-    from game.enums import StarType
-    return {
-        'star_systems': [
-            {
-                'x': 100,
-                'y': 200,
-                'name': 'TestSystem1',
-                'star_type': StarType.MAIN_SEQUENCE,
-                'size': 10,
-                'color': [255, 255, 255],
-                'planets': []
-            }
-        ],
-        'empires': [
-            {
-                'planets': []  # Empty list of planet names for testing
-            }
-        ],
-        'player_empire_index': 0  # First empire is the player's empire
-    }
+@pytest.fixture
+def game_with_mocks(reset_game):
+    """Return the shared, freshly reset Game with to_state mocked.
+    
+    Tests check which transition an action requests, not the view switch.
+    """
+    reset_game.to_state = MagicMock()
+    return reset_game
 
 @pytest.fixture
-def game_with_mocks(mock_pygame, resource_manager):
-    """Create a Game instance with mocked dependencies for testing."""
-    with patch('game.game.ResourceManagerFactory.create', return_value=resource_manager):
-        game = Game()
-        # Mock the views to avoid initialization issues
-        game.startup_view = MagicMock()
-        game.galaxy_view = MagicMock()
-        game.system_view = MagicMock()
-        game.planet_view = MagicMock()
-        return game
+def deterministic_galaxy(game_with_mocks, monkeypatch):
+    """Make star system generation deterministic and collision-free."""
+    game = game_with_mocks
+    # Mock random.randint to return predictable values
+    monkeypatch.setattr('random.randint', lambda min_val, max_val: (min_val + max_val) // 2)
+    monkeypatch.setattr('game.game.StarSystem', MockStarSystem)
+    # generate_star_systems only reads the galaxy_rect size
+    game.galaxy_view.galaxy_rect = SimpleNamespace(width=800, height=600)
+    return game
 
 def test_new_game(game_with_mocks):
     """Test the new_game method."""
     game = game_with_mocks
     # Override generate_star_systems to simulate creation
     game.generate_star_systems = MagicMock()
-    game.to_state = MagicMock()
     
     result = game.new_game()
     
     assert result is True
-    game.to_state.assert_called_once_with(game.state, GameState.GALAXY)
-    assert game.generate_star_systems.called
+    game.to_state.assert_called_once_with(game.state, TRANSITIONS['new_game'])
+    game.generate_star_systems.assert_called_once()
 
 def test_go_to_galaxy_view(game_with_mocks):
     """Test the go_to_galaxy_view method."""
     game = game_with_mocks
     game.state = GameState.SYSTEM
-    game.to_state = MagicMock()
     
     result = game.go_to_galaxy_view()
     
     assert result is True
-    game.to_state.assert_called_once_with(GameState.SYSTEM, GameState.GALAXY)
+    game.to_state.assert_called_once_with(GameState.SYSTEM, TRANSITIONS['go_to_galaxy_view'])
 
-def test_save_game_from_galaxy(game_with_mocks, monkeypatch):
-    """Test saving the game from galaxy view."""
+@pytest.mark.parametrize("state,has_system,expected_result,expected_to", [
+    (GameState.GALAXY, False, False, None),
+    (GameState.GALAXY_MENU, True, True, GameState.SYSTEM),
+    (GameState.GALAXY_MENU, False, True, GameState.GALAXY),
+], ids=["from_galaxy", "from_menu_with_system", "from_menu_without_system"])
+def test_save_game(game_with_mocks, save_game_dummy, state, has_system, expected_result, expected_to):
+    """Test saving the game from the galaxy view and from the galaxy menu.
+    
+    Only a menu call returns True and transitions back to the game, to the
+    system view when a system is selected and to the galaxy view otherwise.
+    """
     game = game_with_mocks
-    monkeypatch.setattr('game.game.save_game_state', dummy_save_game_state)
-    dummy_save_game_state.called = False
     
-    # Test non-menu call
-    game.state = GameState.GALAXY
-    game.selected_system = None
+    game.state = state
+    game.selected_system = Mock(spec=StarSystem) if has_system else None
     
     result = game.save_game()
     
-    assert dummy_save_game_state.called is True
-    assert result is False  # Non-menu call returns False
+    save_game_dummy.assert_called_once_with(
+        game.star_systems, game.selected_system, game.empires, game.player_empire
+    )
+    assert result is expected_result
+    if expected_to is None:
+        game.to_state.assert_not_called()
+    else:
+        game.to_state.assert_called_once_with(state, expected_to)
 
-def test_save_game_from_menu_with_system(game_with_mocks, monkeypatch):
-    """Test saving the game from menu with a selected system."""
-    game = game_with_mocks
-    monkeypatch.setattr('game.game.save_game_state', dummy_save_game_state)
-    dummy_save_game_state.called = False
-    game.to_state = MagicMock()
-    
-    # Test menu call with selected system
-    game.state = GameState.GALAXY_MENU
-    game.selected_system = MagicMock()
-    
-    result = game.save_game()
-    
-    assert dummy_save_game_state.called is True
-    assert result is True  # Menu call returns True
-    game.to_state.assert_called_once_with(GameState.GALAXY_MENU, GameState.SYSTEM)
-
-def test_save_game_from_menu_without_system(game_with_mocks, monkeypatch):
-    """Test saving the game from menu without a selected system."""
-    game = game_with_mocks
-    monkeypatch.setattr('game.game.save_game_state', dummy_save_game_state)
-    dummy_save_game_state.called = False
-    game.to_state = MagicMock()
-    
-    # Test menu call without selected system
-    game.state = GameState.GALAXY_MENU
-    game.selected_system = None
-    
-    result = game.save_game()
-    
-    assert dummy_save_game_state.called is True
-    assert result is True  # Menu call returns True
-    game.to_state.assert_called_once_with(GameState.GALAXY_MENU, GameState.GALAXY)
-
-def test_load_game_success(game_with_mocks, monkeypatch):
+def test_load_game_success(game_with_mocks, load_game_dummy):
     """Test successfully loading a game."""
     game = game_with_mocks
-    monkeypatch.setattr('game.game.load_game_state', dummy_load_game_state)
-    game.to_state = MagicMock()
     
     result = game.load_game()
     
     assert result is True
     assert len(game.star_systems) == 1
     assert game.star_systems[0].name == 'TestSystem1'
-    game.to_state.assert_called_once_with(game.state, GameState.GALAXY)
+    game.to_state.assert_called_once_with(game.state, TRANSITIONS['load_game'])
 
 def test_load_game_failure(game_with_mocks, monkeypatch):
     """Test handling a failed game load."""
@@ -164,74 +134,46 @@ def test_continue_game(game_with_mocks):
     result = game.continue_game()
     
     assert result is True
-    assert game.load_game.called
-
-def test_return_to_game_with_system(game_with_mocks):
-    """Test returning to game with a selected system from a non-galaxy menu state."""
-    game = game_with_mocks
-    game.state = GameState.SYSTEM_MENU  # Any non-GALAXY_MENU state
-    game.selected_system = MagicMock()
-    game.to_state = MagicMock()
-    
-    result = game.return_to_game()
-    
-    assert result is True
-    game.to_state.assert_called_once_with(GameState.SYSTEM_MENU, GameState.SYSTEM)
-
-def test_return_to_game_without_system(game_with_mocks):
-    """Test returning to game without a selected system from a non-galaxy menu state."""
-    game = game_with_mocks
-    game.state = GameState.SYSTEM_MENU  # Any non-GALAXY_MENU state
-    game.selected_system = None
-    game.to_state = MagicMock()
-    
-    result = game.return_to_game()
-    
-    assert result is True
-    game.to_state.assert_called_once_with(GameState.SYSTEM_MENU, GameState.GALAXY)
+    game.load_game.assert_called_once()
 
-def test_return_to_game_from_galaxy_menu_with_system(game_with_mocks):
-    """Test returning to game from galaxy menu with a selected system."""
+@pytest.mark.parametrize("initial,has_system,expected", [
+    (GameState.SYSTEM_MENU, True, GameState.SYSTEM),
+    (GameState.SYSTEM_MENU, False, GameState.GALAXY),
+    (GameState.GALAXY_MENU, True, GameState.SYSTEM),
+    (GameState.GALAXY_MENU, False, GameState.SYSTEM),
+], ids=[
+    "with_system",
+    "without_system",
+    "from_galaxy_menu_with_system",
+    "from_galaxy_menu_without_system",
+])
+def test_return_to_game(game_with_mocks, initial, has_system, expected):
+    """Test returning to game from a menu.
+    
+    The galaxy menu always returns to the system view (without
+    auto-selecting a system); other menus return to the system view only
+    when a system is selected and to the galaxy view otherwise.
+    """
     game = game_with_mocks
-    game.state = GameState.GALAXY_MENU
-    game.selected_system = MagicMock()
-    game.to_state = MagicMock()
+    game.state = initial
+    game.selected_system = Mock(spec=StarSystem) if has_system else None
+    game.star_systems = [SimpleNamespace(name="Auto-selected System")]
     
     result = game.return_to_game()
     
     assert result is True
-    game.to_state.assert_called_once_with(GameState.GALAXY_MENU, GameState.SYSTEM)
-
-def test_return_to_game_from_galaxy_menu_without_system(game_with_mocks):
-    """Test returning to game from galaxy menu without a selected system."""
-    game = game_with_mocks
-    game.state = GameState.GALAXY_MENU
-    game.selected_system = None
-    game.to_state = MagicMock()
-    
-    # Create a mock star system
-    mock_system = MagicMock()
-    mock_system.name = "Auto-selected System"
-    game.star_systems = [mock_system]
-    
-    result = game.return_to_game()
-    
-    assert result is True
-    game.to_state.assert_called_once_with(GameState.GALAXY_MENU, GameState.SYSTEM)
-    # It's OK to not have a selected system in galaxy view
-    # The test was expecting auto-selection, but that's not the intended behavior
+    game.to_state.assert_called_once_with(initial, expected)
 
 def test_quit_to_main_menu(game_with_mocks):
     """Test quitting to the main menu."""
     game = game_with_mocks
-    game.selected_system = MagicMock()
-    game.selected_planet = MagicMock()
-    game.to_state = MagicMock()
+    game.selected_system = Mock(spec=StarSystem)
+    game.selected_planet = SimpleNamespace(name="Test Planet")
     
     result = game.quit_to_main_menu()
     
     assert result is True
-    game.to_state.assert_called_once_with(game.state, GameState.STARTUP_MENU)
+    game.to_state.assert_called_once_with(game.state, TRANSITIONS['quit_to_main_menu'])
     assert game.selected_system is None
     assert game.selected_planet is None
 
@@ -243,26 +185,9 @@ def test_quit_game(game_with_mocks):
     
     assert result is False
 
-def test_generate_star_systems(game_with_mocks, monkeypatch):
+def test_generate_star_systems(deterministic_galaxy):
     """Test generating star systems."""
-    game = game_with_mocks
-    
-    # Mock random.randint to return predictable values
-    monkeypatch.setattr('random.randint', lambda min_val, max_val: (min_val + max_val) // 2)
-    
-    # Mock StarSystem to avoid collisions
-    class MockStarSystem:
-        def __init__(self, x, y, game_instance, **kwargs):
-            self.x = x
-            self.y = y
-            self.game = game_instance
-            self.name = kwargs.get('name', 'MockSystem')
-            self.collides_with = MagicMock(return_value=False)
-    
-    monkeypatch.setattr('game.game.StarSystem', MockStarSystem)
-    
-    # Mock galaxy_rect for positioning
-    game.galaxy_view.galaxy_rect = pygame.Rect(0, 0, 800, 600)
+    game = deterministic_galaxy
     
     # Test the method
     game.generate_star_systems()
@@ -270,64 +195,63 @@ def test_generate_star_systems(game_with_mocks, monkeypatch):
     # Check that star systems were created
     assert len(game.star_systems) > 0
 
-def test_notification_manager(game_with_mocks, monkeypatch):
+def test_notification_manager(game_with_mocks, monkeypatch, freeze_ticks, screen_800x600):
     """Test the notification manager's save notification functionality."""
     game = game_with_mocks
     
     # Mock the UILabel class
     mock_label = MagicMock()
-    with patch('pygame_gui.elements.UILabel', return_value=mock_label) as mock_label_class:
-        # Set up the notification time to be recent
-        current_time = 1000
-        monkeypatch.setattr('pygame.time.get_ticks', lambda: current_time)
-        game.notification_manager.save_notification_time = current_time - 500  # 500ms ago
-        game.notification_manager.save_notification_duration = 2000  # 2 seconds
-        
-        # Create a mock surface to draw on
-        screen = MockSurface((800, 600))
-        
-        # Test the method when notification should be shown
-        game.notification_manager.draw_save_notification(screen)
-        
-        # Verify that a UILabel was created with the correct parameters
-        mock_label_class.assert_called_once()
-        args, kwargs = mock_label_class.call_args
-        assert kwargs['text'] == "Game Saved!"
-        assert kwargs['manager'] == game.ui_manager
-        
-        # Reset mocks for next test
-        mock_label_class.reset_mock()
-        
-        # Test when notification should not be shown (expired)
-        game.notification_manager.save_notification_time = current_time - 3000  # 3 seconds ago
-        
-        # Set the label attribute to simulate an existing label
-        game.notification_manager.save_notification_label = mock_label
-        
-        game.notification_manager.draw_save_notification(screen)
-        
-        # Verify that no new UILabel was created
-        assert not mock_label_class.called
-        
-        # Verify that the existing label was killed
-        assert mock_label.kill.called
-        
-        # Verify that the label attribute was set to None
-        assert game.notification_manager.save_notification_label is None
-        
-        # Test show_save_notification method
-        with patch('pygame.time.get_ticks', return_value=2000):
-            game.notification_manager.show_save_notification()
-            assert game.notification_manager.save_notification_time == 2000
+    mock_label_class = MagicMock(return_value=mock_label)
+    monkeypatch.setattr('pygame_gui.elements.UILabel', mock_label_class)
+    
+    # Set up the notification time to be recent
+    current_time = freeze_ticks[0]
+    game.notification_manager.save_notification_time = current_time - 500  # 500ms ago
+    game.notification_manager.save_notification_duration = 2000  # 2 seconds
+    
+    # Test the method when notification should be shown
+    game.notification_manager.draw_save_notification(screen_800x600)
+    
+    # Verify that a UILabel was created with the correct parameters
+    mock_label_class.assert_called_once()
+    args, kwargs = mock_label_class.call_args
+    assert kwargs['text'] == "Game Saved!"
+    assert kwargs['manager'] == game.ui_manager
+    
+    # Reset mocks for next test
+    mock_label_class.reset_mock()
+    
+    # Test when notification should not be shown (expired)
+    game.notification_manager.save_notification_time = current_time - 3000  # 3 seconds ago
+    
+    # Set the label attribute to simulate an existing label
+    game.notification_manager.save_notification_label = mock_label
+    
+    game.notification_manager.draw_save_notification(screen_800x600)
+    
+    # Verify that no new UILabel was created
+    mock_label_class.assert_not_called()
+    
+    # Verify that the existing label was killed
+    mock_label.kill.assert_called_once()
+    
+    # Verify that the label attribute was set to None
+    assert game.notification_manager.save_notification_label is None
+    
+    # Test show_save_notification method
+    freeze_ticks[0] = 2000
+    game.notification_manager.show_save_notification()
+    assert game.notification_manager.save_notification_time == 2000
 
-def test_cleanup(game_with_mocks):
+def test_cleanup(game_with_mocks, monkeypatch):
     """Test the cleanup method."""
     game = game_with_mocks
-    game.resource_manager.cleanup = MagicMock()
+    resource_cleanup = MagicMock()
     pygame_quit = MagicMock()
+    monkeypatch.setattr(game.resource_manager, 'cleanup', resource_cleanup)
+    monkeypatch.setattr('pygame.quit', pygame_quit)
     
-    with patch('pygame.quit', pygame_quit):
-        game.cleanup()
+    game.cleanup()
     
-    assert game.resource_manager.cleanup.called
-    assert pygame_quit.called
+    resource_cleanup.assert_called_once()
+    pygame_quit.assert_called_once()
@@ -1,38 +1,96 @@
 """Tests for the Menu system."""
 import pytest
-import pygame
-import pygame_gui
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+pygame = pytest.importorskip("pygame")
+pygame_gui = pytest.importorskip("pygame_gui")
+
 from game.menu import Menu, MenuItem
 from game.enums import GameState
 from game.resources import ResourceManager
+from tests.mocks import FakeEvent
 
-@pytest.fixture
+# Key events shared by the keyboard navigation tests; Menu.handle_input only
+# reads event attributes, so FakeEvent stands in for pygame.event.Event
+DOWN_EVT = FakeEvent(pygame.KEYDOWN, pygame.K_DOWN)
+UP_EVT = FakeEvent(pygame.KEYDOWN, pygame.K_UP)
+RETURN_EVT = FakeEvent(pygame.KEYDOWN, pygame.K_RETURN)
+
+@pytest.fixture(scope="session")
 def resource_manager(mock_pygame):
-    """Create a ResourceManager instance for testing."""
+    """Create a ResourceManager shared by the menu tests.
+    
+    Menus only read fonts from it, so one cached instance is enough.
+    """
     return ResourceManager(mock_pygame, mock_pygame.font, mock_pygame.mixer, mock_pygame.display)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ui_manager():
-    """Create a mock UIManager for testing."""
-    ui_manager = MagicMock(spec=pygame_gui.UIManager)
-    return ui_manager
+    """Create a mock UIManager shared by the menu tests.
+    
+    Menus only pass events to it and no test asserts on its calls, so its
+    recorded call history is allowed to accumulate across tests.
+    """
+    return MagicMock(spec=pygame_gui.UIManager)
 
 @pytest.fixture
-def mock_ui_button():
-    """Create a mock UIButton for testing."""
-    button = MagicMock(spec=pygame_gui.elements.UIButton)
-    return button
+def gui_mocks(monkeypatch):
+    """Replace the pygame_gui element classes the menu creates.
+    
+    Returns:
+        SimpleNamespace: The patched UIButton, UIPanel and UILabel classes,
+        plus the button, panel and label instances they return.
+    """
+    mocks = SimpleNamespace(button=MagicMock(), panel=MagicMock(), label=MagicMock())
+    mocks.UIButton = MagicMock(return_value=mocks.button)
+    mocks.UIPanel = MagicMock(return_value=mocks.panel)
+    mocks.UILabel = MagicMock(return_value=mocks.label)
+    for name in ('UIButton', 'UIPanel', 'UILabel'):
+        monkeypatch.setattr(pygame_gui.elements, name, getattr(mocks, name))
+    return mocks
+
+def _make_menu(resource_manager):
+    """Build the three-item menu used by the navigation tests.
+    
+    The second item is disabled; keyboard navigation still moves through it.
+    """
+    items = [
+        MenuItem("Item 1", lambda: None),
+        MenuItem("Item 2", lambda: None, enabled=False),
+        MenuItem("Item 3", lambda: None)
+    ]
+    return Menu(items, "Test Menu", resource_manager)
 
 @pytest.fixture
-def mock_ui_panel():
-    """Create a mock UIPanel for testing."""
-    panel = MagicMock(spec=pygame_gui.elements.UIPanel)
-    return panel
+def menu(resource_manager):
+    """Create an uninitialized three-item menu."""
+    return _make_menu(resource_manager)
+
+@pytest.fixture(scope="module")
+def _shown_menu(resource_manager, mock_screen):
+    """Initialize one three-item menu per module with pygame_gui elements mocked.
+    
+    The elements only need to be patched while initialize() creates them;
+    afterwards the menu holds the MagicMock instances.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ('UIButton', 'UIPanel', 'UILabel'):
+            mp.setattr(f'pygame_gui.elements.{name}', MagicMock())
+        menu = _make_menu(resource_manager)
+        menu.initialize(mock_screen, MagicMock(spec=pygame_gui.UIManager))
+    return menu
 
 @pytest.fixture
+def shown_menu(_shown_menu):
+    """Return the module's initialized menu, visible with the first item selected."""
+    _shown_menu.set_selected(0)
+    _shown_menu.show()
+    return _shown_menu
+
+@pytest.fixture(scope="session")
 def mock_screen():
-    """Create a mock screen for testing."""
+    """Create a mock screen shared by the menu tests."""
     from tests.mocks import MockSurface
     return MockSurface((800, 600))
 
@@ -52,24 +110,8 @@ def test_menu_item():
     item.action()
     assert callback_called
 
-@patch('pygame_gui.elements.UIButton')
-@patch('pygame_gui.elements.UIPanel')
-@patch('pygame_gui.elements.UILabel')
-def test_menu(mock_ui_label, mock_ui_panel, mock_ui_button, mock_screen, resource_manager, mock_ui_manager):
-    """Test Menu initialization and functionality."""
-    # Create menu items
-    items = [
-        MenuItem("Item 1", lambda: None),
-        MenuItem("Item 2", lambda: None, enabled=False),
-        MenuItem("Item 3", lambda: None)
-    ]
-    
-    # Setup mocks
-    mock_ui_button.return_value = MagicMock()
-    mock_ui_panel.return_value = MagicMock()
-    mock_ui_label.return_value = MagicMock()
-    
-    menu = Menu(items, "Test Menu", resource_manager)
+def test_menu(gui_mocks, mock_screen, menu, mock_ui_manager):
+    """Test Menu initialization."""
     assert menu.title == "Test Menu"
     assert len(menu.items) == 3
     
@@ -78,32 +120,33 @@ def test_menu(mock_ui_label, mock_ui_panel, mock_ui_button, mock_screen, resourc
     
     # Show the menu first
     menu.show()
+    assert menu.visible
     
-    # Test selection with keyboard input
+    # The first item starts out selected
     assert menu.selected_index == 0
-    
-    # Simulate pressing down key
-    menu.handle_input(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_DOWN}))
-    assert menu.selected_index == 1
-    
-    # Simulate pressing down key again
-    menu.handle_input(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_DOWN}))
-    assert menu.selected_index == 2
-    
-    # Simulate pressing up key
-    menu.handle_input(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_UP}))
-    assert menu.selected_index == 1
+
+@pytest.mark.parametrize("events,expected_index", [
+    ([DOWN_EVT], 1),
+    ([DOWN_EVT, DOWN_EVT], 2),
+    ([DOWN_EVT, DOWN_EVT, UP_EVT], 1),
+    ([DOWN_EVT, DOWN_EVT, DOWN_EVT], 0),
+    ([UP_EVT], 2),
+    ([UP_EVT, DOWN_EVT], 0),
+], ids=["down", "down_twice", "down_twice_up", "wrap_to_top", "wrap_to_bottom", "wrap_and_back"])
+def test_menu_navigation(shown_menu, events, expected_index):
+    """Test that arrow keys move the selection, wrapping at both ends."""
+    for event in events:
+        shown_menu.handle_input(event)
+    
+    assert shown_menu.selected_index == expected_index
 
 def test_menu_screen_guard(resource_manager):
     """Test menu input handling before initialization."""
     menu = Menu([MenuItem("Test", lambda: None)], resource_manager=resource_manager)
     # Should return None when menu is not initialized
-    assert menu.handle_input(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_RETURN})) is None
+    assert menu.handle_input(RETURN_EVT) is None
 
-@patch('pygame_gui.elements.UIButton')
-@patch('pygame_gui.elements.UIPanel')
-@patch('pygame_gui.elements.UILabel')
-def test_menu_keyboard_activation(mock_ui_label, mock_ui_panel, mock_ui_button, mock_screen, resource_manager, mock_ui_manager):
+def test_menu_keyboard_activation(gui_mocks, mock_screen, resource_manager, mock_ui_manager):
     """Test menu item activation via keyboard."""
     activated = False
     def on_activate():
@@ -111,11 +154,6 @@ def test_menu_keyboard_activation(mock_ui_label, mock_ui_panel, mock_ui_button,
         activated = True
         return "activated"
 
-    # Setup mocks
-    mock_ui_button.return_value = MagicMock()
-    mock_ui_panel.return_value = MagicMock()
-    mock_ui_label.return_value = MagicMock()
-
     menu = Menu([MenuItem("Test", on_activate)], resource_manager=resource_manager)
     menu.initialize(mock_screen, mock_ui_manager)
     
@@ -123,7 +161,7 @@ def test_menu_keyboard_activation(mock_ui_label, mock_ui_panel, mock_ui_button,
     menu.show()
     
     # Test enter key activation
-    result = menu.handle_input(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_RETURN}))
+    result = menu.handle_input(RETURN_EVT)
     assert activated
     assert result == "activated"
     
@@ -135,65 +173,19 @@ def test_menu_keyboard_activation(mock_ui_label, mock_ui_panel, mock_ui_button,
     # Show the menu first
     menu.show()
     
-    result = menu.handle_input(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_RETURN}))
+    result = menu.handle_input(RETURN_EVT)
     assert not activated
     assert result is None
 
-@patch('pygame_gui.elements.UIButton')
-@patch('pygame_gui.elements.UIPanel')
-@patch('pygame_gui.elements.UILabel')
-def test_menu_selection_state(mock_ui_label, mock_ui_panel, mock_ui_button, mock_screen, resource_manager, mock_ui_manager):
-    """Test menu selection state with keyboard navigation."""
-    # Setup mocks
-    mock_ui_button.return_value = MagicMock()
-    mock_ui_panel.return_value = MagicMock()
-    mock_ui_label.return_value = MagicMock()
-    
-    menu = Menu([
-        MenuItem("Item 1", lambda: None),
-        MenuItem("Item 2", lambda: None)
-    ], resource_manager=resource_manager)
-    
-    # Initialize menu
-    menu.initialize(mock_screen, mock_ui_manager)
-    
-    # Show the menu first
-    menu.show()
-    
-    # Initial state
-    assert menu.selected_index == 0
-    
-    # Move selection down
-    menu.handle_input(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_DOWN}))
-    assert menu.selected_index == 1
-    
-    # Test wrapping to top
-    menu.handle_input(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_DOWN}))
-    assert menu.selected_index == 0
-    
-    # Test wrapping to bottom
-    menu.handle_input(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_UP}))
-    assert menu.selected_index == 1
-
-@patch('pygame_gui.elements.UIButton')
-@patch('pygame_gui.elements.UIPanel')
-@patch('pygame_gui.elements.UILabel')
-def test_menu_title_initialization(mock_ui_label, mock_ui_panel, mock_ui_button, mock_screen, resource_manager, mock_ui_manager):
+def test_menu_title_initialization(gui_mocks, mock_screen, resource_manager, mock_ui_manager):
     """Test menu title initialization."""
-    # Setup mocks
-    mock_ui_button.return_value = MagicMock()
-    mock_ui_panel.return_value = MagicMock()
-    mock_ui_label.return_value = MagicMock()
-    
     menu = Menu([MenuItem("Test", lambda: None)], "Menu Title", resource_manager)
     menu.initialize(mock_screen, mock_ui_manager)
     
     # Verify that UILabel was created for the title
-    mock_ui_label.assert_called()
+    gui_mocks.UILabel.assert_called()
 
-@patch('pygame_gui.elements.UIButton')
-@patch('pygame_gui.elements.UIPanel')
-def test_menu_button_click(mock_ui_panel, mock_ui_button, mock_screen, resource_manager, mock_ui_manager):
+def test_menu_button_click(gui_mocks, mock_screen, resource_manager, mock_ui_manager):
     """Test menu button click handling."""
     # Setup button click action
     activated = False
@@ -202,15 +194,9 @@ def test_menu_button_click(mock_ui_panel, mock_ui_button, mock_screen, resource_
         activated = True
         return "activated"
     
-    # Create menu with mock button
+    # Create menu
     menu = Menu([MenuItem("Test", on_activate)], resource_manager=resource_manager)
     
-    # Setup mock button
-    mock_button = MagicMock()
-    mock_ui_button.return_value = mock_button
-    mock_panel = MagicMock()
-    mock_ui_panel.return_value = mock_panel
-    
     # Initialize menu
     menu.initialize(mock_screen, mock_ui_manager)
     
@@ -219,15 +205,16 @@ def test_menu_button_click(mock_ui_panel, mock_ui_button, mock_screen, resource_
     assert menu.visible
     
     # Reset mock call counts
-    mock_panel.hide.reset_mock()
+    gui_mocks.panel.hide.reset_mock()
     
     # Store the created button for reference
     button = menu.buttons[0]
     
     # Simulate button click event
-    button_event = pygame.event.Event(
-        pygame.USEREVENT, 
-        {'user_type': pygame_gui.UI_BUTTON_PRESSED, 'ui_element': button}
+    button_event = FakeEvent(
+        pygame.USEREVENT,
+        user_type=pygame_gui.UI_BUTTON_PRESSED,
+        ui_element=button
     )
     
     # Handle the event
@@ -239,11 +226,9 @@ def test_menu_button_click(mock_ui_panel, mock_ui_button, mock_screen, resource_
     
     # Verify the menu was hidden
     assert not menu.visible
-    mock_panel.hide.assert_called_once()
+    gui_mocks.panel.hide.assert_called_once()
 
-@patch('pygame_gui.elements.UIButton')
-@patch('pygame_gui.elements.UIPanel')
-def test_menu_keyboard_activation_hides_menu(mock_ui_panel, mock_ui_button, mock_screen, resource_manager, mock_ui_manager):
+def test_menu_keyboard_activation_hides_menu(gui_mocks, mock_screen, resource_manager, mock_ui_manager):
     """Test menu is hidden after keyboard activation."""
     activated = False
     def on_activate():
@@ -251,12 +236,6 @@ def test_menu_keyboard_activation_hides_menu(mock_ui_panel, mock_ui_button, mock
         activated = True
         return "activated"
 
-    # Setup mocks
-    mock_ui_button.return_value = MagicMock()
-    mock_panel = MagicMock()
-    mock_ui_panel.return_value = mock_panel
-    mock_ui_label = MagicMock()
-
     menu = Menu([MenuItem("Test", on_activate)], resource_manager=resource_manager)
     menu.initialize(mock_screen, mock_ui_manager)
     
@@ -265,49 +244,42 @@ def test_menu_keyboard_activation_hides_menu(mock_ui_panel, mock_ui_button, mock
     assert menu.visible
     
     # Reset mock call counts
-    mock_panel.hide.reset_mock()
+    gui_mocks.panel.hide.reset_mock()
     
     # Test enter key activation
-    result = menu.handle_input(pygame.event.Event(pygame.KEYDOWN, {'key': pygame.K_RETURN}))
+    result = menu.handle_input(RETURN_EVT)
     assert activated
     assert result == "activated"
     
     # Verify the menu was hidden
     assert not menu.visible
-    mock_panel.hide.assert_called_once()
+    gui_mocks.panel.hide.assert_called_once()
 
-@patch('pygame_gui.elements.UIButton')
-@patch('pygame_gui.elements.UIPanel')
-def test_menu_visibility_control(mock_ui_panel, mock_ui_button, mock_screen, resource_manager, mock_ui_manager):
+def test_menu_visibility_control(gui_mocks, mock_screen, resource_manager, mock_ui_manager):
     """Test menu show/hide functionality."""
     # Create menu
     menu = Menu([MenuItem("Test", lambda: None)], resource_manager=resource_manager)
     
-    # Setup mocks
-    mock_ui_button.return_value = MagicMock()
-    mock_panel = MagicMock()
-    mock_ui_panel.return_value = mock_panel
-    
     # Initialize menu
     menu.initialize(mock_screen, mock_ui_manager)
     
     # Test show
     menu.show()
     assert menu.visible
-    mock_panel.show.assert_called_once()
+    gui_mocks.panel.show.assert_called_once()
     
     # Reset mock call counts
-    mock_panel.hide.reset_mock()
+    gui_mocks.panel.hide.reset_mock()
     
     # Test hide
     menu.hide()
     assert not menu.visible
-    mock_panel.hide.assert_called_once()
+    gui_mocks.panel.hide.assert_called_once()
     
     # Reset mock call counts
-    mock_panel.show.reset_mock()
+    gui_mocks.panel.show.reset_mock()
     
     # Test draw (should show the menu)
     menu.draw(mock_screen)
     assert menu.visible
-    mock_panel.show.assert_called_once()
+    gui_mocks.panel.show.assert_called_once()
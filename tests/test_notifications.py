@@ -5,10 +5,12 @@ This module contains tests for the NotificationManager class in game/notificatio
 """
 
 import pytest
-import pygame
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
+
+pygame = pytest.importorskip("pygame")
+pytest.importorskip("pygame_gui")
+
 from game.notifications import NotificationManager
-from tests.mocks import MockSurface
 
 
 @pytest.fixture
@@ -25,124 +27,48 @@ def test_notification_manager_init(notification_manager):
     assert notification_manager.save_notification_label is None
 
 
-def test_show_save_notification(notification_manager, monkeypatch):
+def test_show_save_notification(notification_manager, freeze_ticks):
     """Test the show_save_notification method."""
-    # Mock pygame.time.get_ticks to return a predictable value
-    monkeypatch.setattr('pygame.time.get_ticks', lambda: 1000)
-    
     notification_manager.show_save_notification()
     
     assert notification_manager.save_notification_time == 1000
 
 
-def test_draw_save_notification_show(notification_manager, monkeypatch):
-    """Test drawing the save notification when it should be shown."""
-    # Mock pygame.time.get_ticks to return a predictable value
-    current_time = 1000
-    monkeypatch.setattr('pygame.time.get_ticks', lambda: current_time)
+@pytest.mark.parametrize("age_ms,preexisting,expect_create,expect_kill", [
+    (500, False, True, False),
+    (500, True, False, False),
+    (3000, True, False, True),
+    (3000, False, False, False),
+], ids=["show_new_label", "show_existing_label", "hide_existing_label", "hide_no_label"])
+def test_draw_save_notification(notification_manager, monkeypatch, freeze_ticks, screen_800x600,
+                                age_ms, preexisting, expect_create, expect_kill):
+    """Test that the save label is created while recent and killed once expired."""
+    # Mock the UILabel class
+    mock_label_class = MagicMock(return_value=MagicMock())
+    monkeypatch.setattr('pygame_gui.elements.UILabel', mock_label_class)
     
-    # Set up the notification time to be recent
-    notification_manager.save_notification_time = current_time - 500  # 500ms ago
+    existing_label = MagicMock() if preexisting else None
+    notification_manager.save_notification_label = existing_label
+    notification_manager.save_notification_time = freeze_ticks[0] - age_ms
     
-    # Mock the UILabel class
-    mock_label = MagicMock()
-    with patch('pygame_gui.elements.UILabel', return_value=mock_label) as mock_label_class:
-        # Create a mock surface to draw on
-        screen = MockSurface((800, 600))
-        
-        # Test the method
-        notification_manager.draw_save_notification(screen)
-        
+    notification_manager.draw_save_notification(screen_800x600)
+    
+    if expect_create:
         # Verify that a UILabel was created with the correct parameters
         mock_label_class.assert_called_once()
         args, kwargs = mock_label_class.call_args
         assert kwargs['text'] == "Game Saved!"
         assert kwargs['manager'] == notification_manager.ui_manager
-        
-        # Verify that the label attribute was set
-        assert notification_manager.save_notification_label == mock_label
-
-
-def test_draw_save_notification_hide(notification_manager, monkeypatch):
-    """Test drawing the save notification when it should be hidden."""
-    # Mock pygame.time.get_ticks to return a predictable value
-    current_time = 1000
-    monkeypatch.setattr('pygame.time.get_ticks', lambda: current_time)
-    
-    # Set up the notification time to be expired
-    notification_manager.save_notification_time = current_time - 3000  # 3 seconds ago
-    
-    # Create a mock label
-    mock_label = MagicMock()
-    notification_manager.save_notification_label = mock_label
-    
-    # Create a mock surface to draw on
-    screen = MockSurface((800, 600))
-    
-    # Test the method
-    notification_manager.draw_save_notification(screen)
-    
-    # Verify that the existing label was killed
-    assert mock_label.kill.called
-    
-    # Verify that the label attribute was set to None
-    assert notification_manager.save_notification_label is None
-
-
-def test_draw_save_notification_no_existing_label(notification_manager, monkeypatch):
-    """Test drawing the save notification when no label exists yet."""
-    # Mock pygame.time.get_ticks to return a predictable value
-    current_time = 1000
-    monkeypatch.setattr('pygame.time.get_ticks', lambda: current_time)
-    
-    # Set up the notification time to be recent
-    notification_manager.save_notification_time = current_time - 500  # 500ms ago
-    
-    # Ensure no label exists
-    notification_manager.save_notification_label = None
-    
-    # Mock the UILabel class
-    mock_label = MagicMock()
-    with patch('pygame_gui.elements.UILabel', return_value=mock_label) as mock_label_class:
-        # Create a mock surface to draw on
-        screen = MockSurface((800, 600))
-        
-        # Test the method
-        notification_manager.draw_save_notification(screen)
-        
-        # Verify that a UILabel was created
-        mock_label_class.assert_called_once()
-        
-        # Verify that the label attribute was set
-        assert notification_manager.save_notification_label == mock_label
-
-
-def test_draw_save_notification_existing_label(notification_manager, monkeypatch):
-    """Test drawing the save notification when a label already exists."""
-    # Mock pygame.time.get_ticks to return a predictable value
-    current_time = 1000
-    monkeypatch.setattr('pygame.time.get_ticks', lambda: current_time)
-    
-    # Set up the notification time to be recent
-    notification_manager.save_notification_time = current_time - 500  # 500ms ago
-    
-    # Create a mock label
-    mock_label = MagicMock()
-    notification_manager.save_notification_label = mock_label
-    
-    # Mock the UILabel class
-    with patch('pygame_gui.elements.UILabel', return_value=MagicMock()) as mock_label_class:
-        # Create a mock surface to draw on
-        screen = MockSurface((800, 600))
-        
-        # Test the method
-        notification_manager.draw_save_notification(screen)
-        
-        # Verify that no new UILabel was created
+        assert notification_manager.save_notification_label == mock_label_class.return_value
+    else:
         mock_label_class.assert_not_called()
-        
-        # Verify that the existing label was not killed
-        assert not mock_label.kill.called
-        
-        # Verify that the label attribute was not changed
-        assert notification_manager.save_notification_label == mock_label
+    
+    if existing_label is not None:
+        if expect_kill:
+            existing_label.kill.assert_called_once()
+            assert notification_manager.save_notification_label is None
+        else:
+            existing_label.kill.assert_not_called()
+            assert notification_manager.save_notification_label == existing_label
+    elif not expect_create:
+        assert notification_manager.save_notification_label is None
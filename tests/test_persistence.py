@@ -2,10 +2,13 @@
 Tests for the persistence module.
 """
 
+import io
 import json
 import os
 import pytest
 from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
+import game.persistence
 from game.persistence import (
     convert_planet_data,
     create_save_data,
@@ -15,6 +18,40 @@ from game.persistence import (
 )
 from game.enums import StarType, PlanetType, ResourceType
 
+# Save file written before empires were persisted: no 'empires' or
+# 'player_empire_index' keys
+LEGACY_SAVE_JSON = """
+{
+    "star_systems": [
+        {
+            "name": "Test System",
+            "x": 100,
+            "y": 200,
+            "star_type": "BLUE_GIANT",
+            "size": 30,
+            "color": [100, 150, 255],
+            "planets": [
+                {
+                    "name": "Planet 1",
+                    "type": "DESERT",
+                    "resources": [{"type": "MINERALS", "amount": 100}],
+                    "angle": 1.0,
+                    "orbit_speed": 0.3
+                },
+                {
+                    "name": "Planet 2",
+                    "type": "OCEANIC",
+                    "resources": [{"type": "CRYSTALS", "amount": 50}],
+                    "angle": 2.0,
+                    "orbit_speed": 0.4
+                }
+            ]
+        }
+    ],
+    "selected_system": "Test System"
+}
+"""
+
 
 class MockPlanet:
     """Mock Planet class for testing."""
@@ -69,6 +106,46 @@ class MockEmpire:
         return self._planets
 
 
+class _FakeFile(io.StringIO):
+    """In-memory file that stores its contents in a fake filesystem on close."""
+    def __init__(self, files, path, initial=''):
+        super().__init__(initial)
+        self._files = files
+        self._path = path
+    
+    def close(self):
+        self._files[self._path] = self.getvalue()
+        super().close()
+
+
+@pytest.fixture
+def fake_fs(monkeypatch):
+    """Back game.persistence's file access with an in-memory dict.
+    
+    Replaces the module's open() and os with fakes covering the calls
+    persistence makes, so save/load round-trips never touch the disk.
+    
+    Returns:
+        dict: Maps file paths to their text contents.
+    """
+    files = {}
+    
+    def fake_open(path, mode='r'):
+        if 'w' in mode:
+            return _FakeFile(files, path)
+        if path not in files:
+            raise FileNotFoundError(path)
+        return io.StringIO(files[path])
+    
+    fake_os = SimpleNamespace(
+        path=SimpleNamespace(join=os.path.join, exists=lambda path: path in files),
+        makedirs=lambda path, exist_ok=False: None,
+    )
+    monkeypatch.setattr(game.persistence, 'open', fake_open, raising=False)
+    monkeypatch.setattr(game.persistence, 'os', fake_os)
+    return files
+
+
 @pytest.fixture
 def test_planet_data():
     return {
@@ -81,8 +158,14 @@ def test_planet_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_star_system():
+    """Build the two-planet star system shared by the whole session.
+    
+    Persistence only reads the graph, so planets are held in a tuple and
+    each resource is a read-only mapping; an accidental mutation raises
+    instead of leaking into later tests.
+    """
     return MockStarSystem(
         x=100,
         y=200,
@@ -90,22 +173,22 @@ def test_star_system():
         star_type=StarType.BLUE_GIANT,
         size=30,
         color=(100, 150, 255),
-        planets=[
+        planets=(
             MockPlanet(
                 name='Planet 1',
                 planet_type=PlanetType.DESERT,
-                resources=[
-                    {'type': ResourceType.MINERALS, 'amount': 100}
-                ]
+                resources=(
+                    MappingProxyType({'type': ResourceType.MINERALS, 'amount': 100}),
+                )
             ),
             MockPlanet(
                 name='Planet 2',
                 planet_type=PlanetType.OCEANIC,
-                resources=[
-                    {'type': ResourceType.CRYSTALS, 'amount': 50}
-                ]
+                resources=(
+                    MappingProxyType({'type': ResourceType.CRYSTALS, 'amount': 50}),
+                )
             )
-        ]
+        )
     )
 
 
@@ -121,6 +204,33 @@ def test_convert_planet_data(test_planet_data):
     assert 'orbit_speed' in result
 
 
+def test_convert_planet_data_shared_resources():
+    """Test that planets with identical resources convert independently."""
+    resources = {ResourceType.MINERALS: 100, ResourceType.CRYSTALS: 50}
+    first = convert_planet_data({'name': 'First', 'type': PlanetType.DESERT, 'resources': resources})
+    second = convert_planet_data({'name': 'Second', 'type': PlanetType.DESERT, 'resources': resources})
+    
+    assert first['resources'] == [
+        {'type': 'MINERALS', 'amount': 100},
+        {'type': 'CRYSTALS', 'amount': 50}
+    ]
+    assert second['resources'] == first['resources']
+
+
+def test_convert_planet_data_float_amounts():
+    """Test that float resource amounts are saved as floats, not coerced to ints."""
+    for amount in (100, 100.0):
+        result = convert_planet_data({
+            'name': 'Test Planet',
+            'type': PlanetType.DESERT,
+            'resources': {ResourceType.MINERALS: amount}
+        })
+        
+        saved = result['resources'][0]['amount']
+        assert saved == amount
+        assert type(saved) is type(amount)
+
+
 def test_create_save_data(test_star_system):
     result = create_save_data([test_star_system], test_star_system)
     
@@ -137,14 +247,18 @@ def test_create_save_data(test_star_system):
     assert 'timestamp' in result
 
 
-def test_save_and_load_game_state(test_star_system, tmp_path):
-    # Use temporary directory for test
-    save_dir = str(tmp_path)
+@pytest.mark.parametrize("with_empires", [True, False], ids=["with_empires", "without_empires"])
+def test_save_and_load_game_state(test_star_system, fake_fs, with_empires):
+    save_dir = 'saves'
     
-    # Create mock empire with a planet
-    mock_planet = test_star_system.planets[0]  # Use first planet from test system
-    mock_empire = MockEmpire([mock_planet])
-    mock_empires = [mock_empire]
+    if with_empires:
+        # Create mock empire with a planet
+        mock_planet = test_star_system.planets[0]  # Use first planet from test system
+        mock_empire = MockEmpire([mock_planet])
+        mock_empires = [mock_empire]
+    else:
+        mock_empire = None
+        mock_empires = None
     
     # Save game state
     save_game_state(
@@ -171,9 +285,13 @@ def test_save_and_load_game_state(test_star_system, tmp_path):
     
     # Verify empire data
     assert 'empires' in loaded_data
-    assert len(loaded_data['empires']) == 1
-    assert loaded_data['empires'][0]['planets'] == ['Planet 1']  # Planet name from test_star_system
-    assert loaded_data['player_empire_index'] == 0
+    if with_empires:
+        assert len(loaded_data['empires']) == 1
+        assert loaded_data['empires'][0]['planets'] == ['Planet 1']  # Planet name from test_star_system
+        assert loaded_data['player_empire_index'] == 0
+    else:
+        assert loaded_data['empires'] == []
+        assert loaded_data['player_empire_index'] is None
     
     # Check if resources is a dictionary (new format) or a list (old format)
     planet_resources = system['planets'][0]['resources']
@@ -185,13 +303,35 @@ def test_save_and_load_game_state(test_star_system, tmp_path):
         assert planet_resources[0]['type'] == ResourceType.MINERALS
 
 
+@pytest.mark.parametrize("backend", ["json", "orjson"])
+def test_json_backend_round_trip(monkeypatch, backend):
+    """Test that save data survives an encode/decode round trip on each backend."""
+    if backend == "json":
+        monkeypatch.setattr(game.persistence, 'orjson', None)
+    else:
+        monkeypatch.setattr(game.persistence, 'orjson', pytest.importorskip("orjson"))
+    data = {
+        'star_systems': [{'name': 'Sol', 'color': (255, 255, 0), 'planets': []}],
+        'selected_system': None,
+        'empires': [],
+        'player_empire_index': None
+    }
+    
+    text = game.persistence._dumps(data)
+    
+    assert isinstance(text, str)
+    assert game.persistence._loads(text) == json.loads(json.dumps(data))
+
+
+@pytest.mark.slow
 def test_save_exists_nonexistent_file(tmp_path):
+    # Runs against the real filesystem to keep one integration check of save_exists
     assert not save_exists(save_dir=str(tmp_path))
 
 
-def test_load_game_state_file_not_found(tmp_path):
+def test_load_game_state_file_not_found(fake_fs):
     with pytest.raises(FileNotFoundError):
-        load_game_state(save_dir=str(tmp_path))
+        load_game_state(save_dir='saves')
 
 
 def test_create_save_data_no_selected_system(test_star_system):
@@ -199,31 +339,13 @@ def test_create_save_data_no_selected_system(test_star_system):
     assert result['selected_system'] is None
 
 
-def test_load_game_state_without_empires(test_star_system, tmp_path):
+def test_load_game_state_without_empires(fake_fs):
     """Test loading a game state that doesn't have empire data (backward compatibility)."""
-    save_dir = str(tmp_path)
+    save_dir = 'saves'
     save_path = os.path.join(save_dir, 'autosave.json')
     
-    # Create a save file without empire data
-    save_data = {
-        'star_systems': [
-            {
-                'name': test_star_system.name,
-                'x': test_star_system.x,
-                'y': test_star_system.y,
-                'star_type': test_star_system.star_type.name,
-                'size': test_star_system.size,
-                'color': test_star_system.color,
-                'planets': [convert_planet_data(p) for p in test_star_system.planets]
-            }
-        ],
-        'selected_system': test_star_system.name
-    }
-    
-    # Save directly to file
-    os.makedirs(save_dir, exist_ok=True)
-    with open(save_path, 'w') as f:
-        json.dump(save_data, f)
+    # Write a save file without empire data directly into the fake filesystem
+    fake_fs[save_path] = LEGACY_SAVE_JSON
     
     # Load game state
     loaded_data = load_game_state(save_dir=save_dir)
@@ -5,27 +5,12 @@ import pygame
 from pygame.locals import K_ESCAPE
 from unittest.mock import MagicMock, patch
 
-# Initialize pygame and font module for testing
-pygame.init()
-if not pygame.font.get_init():
-    pygame.font.init()
-
-# Import game modules after pygame initialization
 from game.views.planet import PlanetView
 from game.planet import Planet
 from game.enums import PlanetType, ResourceType, GameState
 from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 from tests.mocks import MockGame, MockInfoPanel
 
-@pytest.fixture(autouse=True)
-def setup_and_cleanup():
-    """Setup and cleanup pygame for each test."""
-    pygame.init()
-    pygame.font.init()
-    yield
-    pygame.font.quit()
-    pygame.quit()
-
 @pytest.fixture
 def mock_planet_view_info_panel():
     """Mock the PlanetViewInfoPanel class."""
@@ -40,9 +25,9 @@ def mock_planet_view_info_panel():
         mock_panel_class.return_value = mock_panel
         yield mock_panel_class
 
-def test_planet_view_initialization(mock_planet_view_info_panel):
+def test_planet_view_initialization(mock_planet_view_info_panel, ui_manager):
     """Test PlanetView initialization."""
-    game = MockGame()
+    game = MockGame(ui_manager)
     view = PlanetView(game)
     
     assert view.game == game
@@ -52,34 +37,28 @@ def test_planet_view_initialization(mock_planet_view_info_panel):
     assert view.title_font is not None
     assert view.info_font is not None
 
-def test_planet_view_draw_without_selected_planet(mock_planet_view_info_panel):
+def test_planet_view_draw_without_selected_planet(mock_planet_view_info_panel, ui_manager, screen_surface):
     """Test drawing planet view with no selected planet."""
-    game = MockGame()
+    game = MockGame(ui_manager)
     game.selected_planet = None
     view = PlanetView(game)
     
-    # Create a mock screen surface
-    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    
     # Should not raise any errors
-    view.draw(screen)
+    view.draw(screen_surface)
 
-def test_planet_view_draw_with_planet(mock_planet_view_info_panel):
+def test_planet_view_draw_with_planet(mock_planet_view_info_panel, ui_manager, screen_surface):
     """Test drawing planet view with a selected planet."""
-    game = MockGame()
+    game = MockGame(ui_manager)
     view = PlanetView(game)
     
-    # Create a mock screen surface
-    screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    
     # Mock pygame.draw.circle to avoid errors with Surface objects
     with patch('pygame.draw.circle'):
         # Should not raise any errors
-        view.draw(screen)
+        view.draw(screen_surface)
 
-def test_planet_view_handle_keydown(mock_planet_view_info_panel):
+def test_planet_view_handle_keydown(mock_planet_view_info_panel, ui_manager):
     """Test planet view key press handling."""
-    game = MockGame()
+    game = MockGame(ui_manager)
     view = PlanetView(game)
     
     # Create a mock key event
@@ -9,19 +9,10 @@ from game.enums import GameState, PlanetType, ResourceType
 from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 from tests.mocks import MockGame, MockSurface
 
-@pytest.fixture(autouse=True)
-def setup_and_cleanup():
-    """Setup and cleanup pygame for each test."""
-    pygame.init()
-    pygame.font.init()
-    yield
-    pygame.font.quit()
-    pygame.quit()
-
 @pytest.fixture
-def mock_game():
+def mock_game(ui_manager):
     """Create a mock game instance for testing."""
-    return MockGame()
+    return MockGame(ui_manager)
 
 @pytest.fixture
 def mock_screen():
@@ -200,7 +191,7 @@ class TestPlanetViewDrawing:
             mock_game.selected_planet = planet
             
             # Mock the background and panel draw methods
-            mock_game.background.draw_system_background = MagicMock()
+            mock_game.background = MagicMock()
             
             # Mock PlanetProperties.PROPERTIES to avoid KeyError
             with patch('game.views.planet.PlanetProperties.PROPERTIES', {
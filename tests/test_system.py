@@ -9,19 +9,10 @@ from game.enums import GameState, PlanetType, ResourceType
 from game.constants import SCREEN_WIDTH, SCREEN_HEIGHT
 from tests.mocks import MockGame, MockSurface
 
-@pytest.fixture(autouse=True)
-def setup_and_cleanup():
-    """Setup and cleanup pygame for each test."""
-    pygame.init()
-    pygame.font.init()
-    yield
-    pygame.font.quit()
-    pygame.quit()
-
 @pytest.fixture
-def mock_game():
+def mock_game(ui_manager):
     """Create a mock game instance for testing."""
-    return MockGame()
+    return MockGame(ui_manager)
 
 @pytest.fixture
 def mock_screen():
@@ -350,7 +341,7 @@ class TestSystemViewDrawing:
         mock_game.state = GameState.SYSTEM
         
         # Mock the background and panel draw methods
-        mock_game.background.draw_system_background = MagicMock()
+        mock_game.background = MagicMock()
         system_view.panel.draw = MagicMock()
         
         # Draw the view
@@ -367,7 +358,7 @@ class TestSystemViewDrawing:
         mock_game.selected_system = None
         
         # Mock the background draw method
-        mock_game.background.draw_system_background = MagicMock()
+        mock_game.background = MagicMock()
         
         # Draw the view
         system_view.draw(mock_screen)
@@ -384,7 +375,7 @@ class TestSystemViewDrawing:
         mock_game.state = GameState.SYSTEM_MENU
         
         # Mock the background and panel draw methods
-        mock_game.background.draw_system_background = MagicMock()
+        mock_game.background = MagicMock()
         system_view.panel.draw = MagicMock()
         
         # Draw the view